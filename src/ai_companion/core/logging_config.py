@@ -3,10 +3,18 @@
 import logging
 import os
 import sys
+from collections.abc import Callable
+from typing import Any
 
+import orjson
 import structlog
 
 
+def _orjson_dumps(obj: Any, *, default: Callable[[Any], Any] | None = None, **kwargs: Any) -> str:
+    """Serialize a log event with orjson, keeping JSONRenderer's fallback for unknown types."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def configure_logging() -> None:
     """Configure structured logging with JSON output for production.
 
@@ -48,7 +56,8 @@ def configure_logging() -> None:
 
     # Add appropriate renderer based on environment
     if use_json:
-        processors.append(structlog.processors.JSONRenderer())
+        # Every log line passes through the renderer; orjson is several times faster than stdlib json
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
@@ -9,14 +9,14 @@ to recover while providing fast failure responses to clients.
 Module Dependencies:
 - ai_companion.core.exceptions: CircuitBreakerError exception type
 - ai_companion.settings: Configuration for failure thresholds and timeouts (lazy import)
-- Standard library: logging, functools, typing, time
+- Standard library: inspect, logging, threading, time, enum, functools, typing
 
 Dependents (modules that import this):
 - ai_companion.modules.speech.speech_to_text: Groq circuit breaker for STT
+- ai_companion.modules.speech.stt_provider: Groq circuit breaker for STT
 - ai_companion.modules.speech.text_to_speech: ElevenLabs circuit breaker for TTS
 - ai_companion.modules.memory.long_term.vector_store: Qdrant circuit breaker
-- ai_companion.interfaces.chainlit.app: Circuit breaker error handling
-- ai_companion.interfaces.whatsapp.whatsapp_response: Circuit breaker error handling
+- ai_companion.interfaces.web.routes.voice: Circuit breaker error handling
 
 Architecture:
 This module is part of the core layer and provides resilience patterns for external
@@ -32,7 +32,12 @@ Design Reference:
 - .kiro/specs/technical-debt-management/design.md: Circuit Breaker Refactoring
 """
 
+import asyncio
+import inspect
 import logging
+import threading
+import time
+from enum import IntEnum
 from functools import wraps
 from typing import Any, Callable, Optional, TypeVar
 
@@ -43,6 +48,29 @@ logger = logging.getLogger(__name__)
 # Type variable for generic function signatures
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Metadata copied onto wrappers. Skips __dict__ merging and __annotations__/__type_params__
+# copying done by default; __wrapped__ is always set so inspect.unwrap() still works.
+_WRAPPER_ASSIGNMENTS = ("__module__", "__name__", "__qualname__", "__doc__")
+
+
+class CircuitState(IntEnum):
+    """Circuit breaker states, stored as ints for cheap hot-path comparisons."""
+
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+_CLOSED = CircuitState.CLOSED
+_OPEN = CircuitState.OPEN
+_HALF_OPEN = CircuitState.HALF_OPEN
+
+# Indexed by CircuitState value; keeps the public string API of ``state``
+_STATE_NAMES = ("CLOSED", "OPEN", "HALF_OPEN")
+
+# Bound once so clock reads skip the attribute lookup on the time module
+_monotonic_ns = time.monotonic_ns
+
 
 class CircuitBreaker:
     """Circuit breaker implementation for external service calls.
@@ -52,42 +80,72 @@ class CircuitBreaker:
     - OPEN: Too many failures, requests are blocked
     - HALF_OPEN: Testing if service has recovered
 
+    Thread safety:
+    State reads and transitions are guarded by a reentrant lock so a breaker
+    can be shared between threads (e.g. sync calls made from asyncio.to_thread
+    workers). The lock is never held while the wrapped function runs, so
+    protected calls still execute concurrently. The async path shares the same
+    lock; its critical sections never await, so they cannot block the event loop.
+
     Args:
         failure_threshold: Number of failures before opening circuit
         recovery_timeout: Seconds to wait before attempting recovery
-        expected_exception: Exception type to catch (defaults to Exception)
+        expected_exception: Exception type, or tuple of types, to count as failures
+            (defaults to Exception)
         name: Name for logging purposes
+        skip_exceptions: Exception types that propagate without counting as failures,
+            such as programming errors (TypeError, AttributeError) that indicate a bug in
+            the caller rather than an unhealthy upstream service. Empty by default.
     """
 
     def __init__(
         self,
         failure_threshold: int = 5,
         recovery_timeout: int = 60,
-        expected_exception: type[Exception] = Exception,
+        expected_exception: type[Exception] | tuple[type[Exception], ...] = Exception,
         name: str = "CircuitBreaker",
+        skip_exceptions: tuple[type[Exception], ...] = (),
     ):
+        if failure_threshold <= 0:
+            raise ValueError(f"{name}: failure_threshold must be at least 1 (got {failure_threshold})")
+
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
         self.name = name
+        self.skip_exceptions = skip_exceptions
+
+        self._recovery_timeout_ns = recovery_timeout * 1_000_000_000
+        self._open_error_message = f"{name}: Circuit breaker is open, service unavailable"
 
         self._failure_count = 0
-        self._last_failure_time: Optional[float] = None
-        self._state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        # Monotonic deadline (ns) after which an OPEN circuit may probe recovery;
+        # monotonic time is immune to wall-clock adjustments (NTP, DST)
+        self._open_until_ns = 0
+        self._state = _CLOSED
+        self._lock = threading.RLock()
+        # Set while an async HALF_OPEN probe is in flight; other async callers wait on it
+        self._probe_event: Optional[asyncio.Event] = None
 
     @property
     def state(self) -> str:
-        """Get current circuit breaker state."""
-        return self._state
+        """Get current circuit breaker state ("CLOSED", "OPEN" or "HALF_OPEN")."""
+        return _STATE_NAMES[self._state]
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt recovery."""
-        if self._last_failure_time is None:
-            return False
+        return _monotonic_ns() >= self._open_until_ns
 
-        import time
+    def _open(self) -> None:
+        """Transition to OPEN and start the recovery timer. Caller holds the lock."""
+        self._state = _OPEN
+        self._open_until_ns = _monotonic_ns() + self._recovery_timeout_ns
 
-        return (time.time() - self._last_failure_time) >= self.recovery_timeout
+    def _close(self) -> None:
+        """Transition to CLOSED and clear failure tracking. Caller holds the lock."""
+        self._state = _CLOSED
+        self._failure_count = 0
+        self._open_until_ns = 0
 
     def _check_circuit_state(self) -> None:
         """Check circuit state and transition to HALF_OPEN if recovery timeout elapsed.
@@ -102,16 +160,17 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError: If circuit is OPEN and recovery timeout has not elapsed
         """
-        if self._state == "OPEN":
-            # Check if enough time has passed to attempt recovery
-            if self._should_attempt_reset():
-                # Transition to HALF_OPEN: allow one request to test service recovery
-                logger.info(f"{self.name}: Attempting recovery (HALF_OPEN)")
-                self._state = "HALF_OPEN"
-            else:
-                # Still in recovery period: block request and fail fast
-                logger.warning(f"{self.name}: Circuit is OPEN, blocking request")
-                raise CircuitBreakerError(f"{self.name}: Circuit breaker is open, service unavailable")
+        with self._lock:
+            if self._state == _OPEN:
+                # Check if enough time has passed to attempt recovery
+                if self._should_attempt_reset():
+                    # Transition to HALF_OPEN: allow one request to test service recovery
+                    logger.info("%s: Attempting recovery (HALF_OPEN)", self.name)
+                    self._state = _HALF_OPEN
+                else:
+                    # Still in recovery period: block request and fail fast
+                    logger.warning("%s: Circuit is OPEN, blocking request", self.name)
+                    raise CircuitBreakerError(self._open_error_message)
 
     def _handle_success(self) -> None:
         """Handle successful call, resetting circuit if in HALF_OPEN state.
@@ -123,12 +182,11 @@ class CircuitBreaker:
           - Reset failure count and timestamp
         - OPEN: Should not reach here (blocked by _check_circuit_state)
         """
-        if self._state == "HALF_OPEN":
-            # Test request succeeded: service has recovered
-            logger.info(f"{self.name}: Recovery successful, closing circuit")
-            self._state = "CLOSED"
-            self._failure_count = 0
-            self._last_failure_time = None
+        with self._lock:
+            if self._state == _HALF_OPEN:
+                # Test request succeeded: service has recovered
+                logger.info("%s: Recovery successful, closing circuit", self.name)
+                self._close()
 
     def _handle_failure(self, exception: Exception) -> None:
         """Handle failed call, opening circuit if threshold reached.
@@ -143,23 +201,30 @@ class CircuitBreaker:
         Args:
             exception: The exception that was raised
         """
-        # Increment failure counter regardless of current state
-        self._failure_count += 1
-        logger.warning(
-            f"{self.name}: Failure {self._failure_count}/{self.failure_threshold} - {type(exception).__name__}: {str(exception)}"
-        )
-
-        # Open circuit if threshold reached (prevents cascading failures)
-        # This gives the failing service time to recover without being overwhelmed
-        if self._failure_count >= self.failure_threshold:
-            import time
-
-            self._state = "OPEN"
-            self._last_failure_time = time.time()  # Start recovery timer
-            logger.error(
-                f"{self.name}: Circuit breaker OPENED after {self._failure_count} failures. "
-                f"Will retry in {self.recovery_timeout}s"
-            )
+        with self._lock:
+            # Increment failure counter regardless of current state
+            self._failure_count += 1
+            # str(exception) can be large (API response bodies); only format it if emitted
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "%s: Failure %d/%d - %s: %s",
+                    self.name,
+                    self._failure_count,
+                    self.failure_threshold,
+                    type(exception).__name__,
+                    exception,
+                )
+
+            # Open circuit if threshold reached (prevents cascading failures)
+            # This gives the failing service time to recover without being overwhelmed
+            if self._failure_count >= self.failure_threshold:
+                self._open()
+                logger.error(
+                    "%s: Circuit breaker OPENED after %d failures. Will retry in %ss",
+                    self.name,
+                    self._failure_count,
+                    self.recovery_timeout,
+                )
 
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute function with circuit breaker protection.
@@ -176,16 +241,23 @@ class CircuitBreaker:
             CircuitBreakerError: If circuit is open
             Exception: Original exception if circuit is closed
         """
-        self._check_circuit_state()
+        # Fast path: a CLOSED circuit needs neither the locked gate nor the success handler
+        if self._state != _CLOSED:
+            self._check_circuit_state()
 
         try:
             result = func(*args, **kwargs)
-            self._handle_success()
-            return result
+        except self.skip_exceptions:
+            # Caller bugs say nothing about upstream health; don't count them
+            raise
         except self.expected_exception as e:
             self._handle_failure(e)
             raise
 
+        if self._state != _CLOSED:
+            self._handle_success()
+        return result
+
     async def call_async(self, func: Callable, *args, **kwargs) -> Any:
         """Execute async function with circuit breaker protection.
 
@@ -200,42 +272,110 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError: If circuit is open
             Exception: Original exception if circuit is closed
+
+        While HALF_OPEN, only one concurrent caller probes the recovering service;
+        the others wait for its outcome and then proceed (CLOSED) or fail fast (OPEN).
         """
-        self._check_circuit_state()
+        owner = False
+        # Fast path: a CLOSED circuit needs neither the locked gate nor the success handler
+        if self._state != _CLOSED:
+            self._check_circuit_state()
+            probe, owner = self._claim_probe()
+            if probe is not None and not owner:
+                await probe.wait()
+                return await self.call_async(func, *args, **kwargs)
 
         try:
             result = await func(*args, **kwargs)
-            self._handle_success()
-            return result
+        except self.skip_exceptions:
+            # Caller bugs say nothing about upstream health; don't count them
+            raise
         except self.expected_exception as e:
             self._handle_failure(e)
             raise
+        finally:
+            if owner:
+                self._release_probe()
+
+        if self._state != _CLOSED:
+            self._handle_success()
+        return result
+
+    def _claim_probe(self) -> tuple[Optional[asyncio.Event], bool]:
+        """Claim the single async recovery probe while HALF_OPEN.
+
+        Returns:
+            (event, owner): event is None when the circuit is not HALF_OPEN. Otherwise
+            owner is True for the caller that must run the probe and False for callers
+            that should wait on the event for the probe's outcome.
+        """
+        with self._lock:
+            if self._state != _HALF_OPEN:
+                return None, False
+            if self._probe_event is None:
+                self._probe_event = asyncio.Event()
+                return self._probe_event, True
+            return self._probe_event, False
+
+    def _release_probe(self) -> None:
+        """Wake callers waiting on the in-flight probe."""
+        with self._lock:
+            event, self._probe_event = self._probe_event, None
+        if event is not None:
+            event.set()
 
     def reset(self) -> None:
         """Manually reset the circuit breaker to CLOSED state."""
-        logger.info(f"{self.name}: Manually resetting circuit breaker")
-        self._state = "CLOSED"
-        self._failure_count = 0
-        self._last_failure_time = None
+        logger.info("%s: Manually resetting circuit breaker", self.name)
+        with self._lock:
+            self._close()
+
+
+class NullCircuitBreaker(CircuitBreaker):
+    """Pass-through breaker used when circuit breaking is disabled.
+
+    Calls go straight to the wrapped function with no state checks, locking or
+    failure accounting. It subclasses CircuitBreaker so callers typed against
+    CircuitBreaker need no changes; ``state`` always reports "CLOSED".
+    """
+
+    def __init__(self, name: str = "CircuitBreaker"):
+        super().__init__(name=name)
+
+    def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Execute function directly."""
+        return func(*args, **kwargs)
+
+    async def call_async(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Execute async function directly."""
+        return await func(*args, **kwargs)
 
 
 def circuit_breaker(
     failure_threshold: int = 5,
     recovery_timeout: int = 60,
-    expected_exception: type[Exception] = Exception,
+    expected_exception: type[Exception] | tuple[type[Exception], ...] = Exception,
     name: Optional[str] = None,
+    skip_exceptions: tuple[type[Exception], ...] = (),
 ) -> Callable[[F], F]:
     """Decorator to add circuit breaker protection to a function.
 
     Args:
         failure_threshold: Number of failures before opening circuit
         recovery_timeout: Seconds to wait before attempting recovery
-        expected_exception: Exception type to catch
+        expected_exception: Exception type, or tuple of types, to count as failures
         name: Name for logging (defaults to function name)
+        skip_exceptions: Exception types that propagate without counting as failures
+
+    When FEATURE_CIRCUIT_BREAKER_ENABLED is off, functions are returned undecorated,
+    so there is no per-call overhead.
 
     Returns:
         Decorated function with circuit breaker protection
 
+    Raises:
+        ValueError: If failure_threshold is less than 1
+
     Example:
         @circuit_breaker(failure_threshold=3, recovery_timeout=30)
         async def call_external_api():
@@ -247,36 +387,29 @@ def circuit_breaker(
         recovery_timeout=recovery_timeout,
         expected_exception=expected_exception,
         name=name or "CircuitBreaker",
+        skip_exceptions=skip_exceptions,
     )
 
     def decorator(func: F) -> F:
-        if hasattr(func, "__self__"):
-            # Instance method
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                return await breaker.call_async(func, *args, **kwargs)
+        from ai_companion.settings import settings
 
-            @wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                return breaker.call(func, *args, **kwargs)
+        if not settings.FEATURE_CIRCUIT_BREAKER_ENABLED:
+            return func
 
-        else:
-            # Regular function
-            @wraps(func)
+        # Build only the wrapper matching the function type
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
             async def async_wrapper(*args, **kwargs):
                 return await breaker.call_async(func, *args, **kwargs)
 
-            @wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                return breaker.call(func, *args, **kwargs)
+            return async_wrapper  # type: ignore
 
-        # Return appropriate wrapper based on whether function is async
-        import inspect
+        @wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
+        def sync_wrapper(*args, **kwargs):
+            return breaker.call(func, *args, **kwargs)
 
-        if inspect.iscoroutinefunction(func):
-            return async_wrapper  # type: ignore
-        else:
-            return sync_wrapper  # type: ignore
+        return sync_wrapper  # type: ignore
 
     return decorator
 
@@ -287,6 +420,21 @@ _elevenlabs_circuit_breaker: Optional[CircuitBreaker] = None
 _qdrant_circuit_breaker: Optional[CircuitBreaker] = None
 
 
+def _create_service_circuit_breaker(name: str) -> CircuitBreaker:
+    """Create a per-service breaker from settings, or a pass-through if disabled."""
+    from ai_companion.settings import settings
+
+    if not settings.FEATURE_CIRCUIT_BREAKER_ENABLED:
+        return NullCircuitBreaker(name=name)
+
+    return CircuitBreaker(
+        failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+        expected_exception=Exception,
+        name=name,
+    )
+
+
 def get_groq_circuit_breaker() -> CircuitBreaker:
     """Get the global Groq circuit breaker instance.
 
@@ -298,14 +446,7 @@ def get_groq_circuit_breaker() -> CircuitBreaker:
     """
     global _groq_circuit_breaker
     if _groq_circuit_breaker is None:
-        from ai_companion.settings import settings
-
-        _groq_circuit_breaker = CircuitBreaker(
-            failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-            recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
-            expected_exception=Exception,
-            name="GroqAPI",
-        )
+        _groq_circuit_breaker = _create_service_circuit_breaker("GroqAPI")
     return _groq_circuit_breaker
 
 
@@ -320,14 +461,7 @@ def get_elevenlabs_circuit_breaker() -> CircuitBreaker:
     """
     global _elevenlabs_circuit_breaker
     if _elevenlabs_circuit_breaker is None:
-        from ai_companion.settings import settings
-
-        _elevenlabs_circuit_breaker = CircuitBreaker(
-            failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-            recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
-            expected_exception=Exception,
-            name="ElevenLabsAPI",
-        )
+        _elevenlabs_circuit_breaker = _create_service_circuit_breaker("ElevenLabsAPI")
     return _elevenlabs_circuit_breaker
 
 
@@ -342,12 +476,5 @@ def get_qdrant_circuit_breaker() -> CircuitBreaker:
     """
     global _qdrant_circuit_breaker
     if _qdrant_circuit_breaker is None:
-        from ai_companion.settings import settings
-
-        _qdrant_circuit_breaker = CircuitBreaker(
-            failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-            recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
-            expected_exception=Exception,
-            name="QdrantAPI",
-        )
+        _qdrant_circuit_breaker = _create_service_circuit_breaker("QdrantAPI")
     return _qdrant_circuit_breaker
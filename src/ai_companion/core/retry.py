@@ -1,14 +1,39 @@
 """Retry utilities for API calls with exponential backoff."""
 
+import asyncio
 import logging
+import random
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, TypeVar, cast
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Identity metadata only, as in core.resilience; __wrapped__ is still set by wraps()
+_WRAPPER_ASSIGNMENTS = ("__module__", "__name__", "__qualname__", "__doc__")
+
+# Dedicated generator for retry jitter; avoids contending on the global random instance
+_rng = random.Random()
+
+
+def _as_exception_tuple(spec: type[BaseException] | tuple | list) -> tuple[type[BaseException], ...]:
+    """Normalize an exception spec to the tuple form an except clause accepts."""
+    return (spec,) if isinstance(spec, type) else tuple(spec)
+
+
+@lru_cache(maxsize=32)
+def _backoff_schedule(max_retries: int, initial_backoff: float, max_backoff: float) -> tuple[float, ...]:
+    """Precompute the wait before each retry: initial_backoff * 2**attempt, capped at max_backoff."""
+    return tuple(min(initial_backoff * (1 << attempt), max_backoff) for attempt in range(max(max_retries - 1, 0)))
+
+
+def _log_single_attempt_failure(name: str, e: BaseException) -> None:
+    """Log a failed single-attempt call the way the retry loop logs its last attempt."""
+    logger.warning(f"{name} attempt 1/1 failed: {type(e).__name__}: {str(e)}", exc_info=True)
+    logger.error(f"{name} failed after 1 attempts: {str(e)}")
+
 
 def retry_with_exponential_backoff(
     max_retries: int = 3,
@@ -23,8 +48,11 @@ def retry_with_exponential_backoff(
         max_retries: Maximum number of retry attempts
         initial_backoff: Initial backoff time in seconds
         max_backoff: Maximum backoff time in seconds
-        exceptions: Tuple of exceptions to catch and retry
-        skip_exceptions: Tuple of exceptions to not retry (raise immediately)
+        exceptions: Exception type(s) to catch and retry
+        skip_exceptions: Exception type(s) to not retry (raise immediately)
+
+    Each wait is drawn uniformly from [0, min(initial_backoff * 2**attempt, max_backoff)]
+    ("full jitter") so callers that failed together do not retry in lockstep.
 
     Returns:
         Decorated function with retry logic
@@ -34,9 +62,30 @@ def retry_with_exponential_backoff(
         def call_api():
             return api.request()
     """
+    # The schedule is fixed for a given configuration, so compute it once per decoration
+    backoff_schedule = _backoff_schedule(max_retries, initial_backoff, max_backoff)
+    # Bound once here so a list or single type is not re-validated on every failure
+    exceptions = _as_exception_tuple(exceptions)
+    skip_exceptions = _as_exception_tuple(skip_exceptions)
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
+        if max_retries == 1:
+            # A single attempt has nothing to retry; skip the loop and backoff but keep the failure logs
+
+            @wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
+            def single_attempt(*args: Any, **kwargs: Any) -> T:
+                try:
+                    return func(*args, **kwargs)
+                except skip_exceptions as e:
+                    logger.debug(f"Skipping retry for {type(e).__name__}: {str(e)}")
+                    raise
+                except exceptions as e:
+                    _log_single_attempt_failure(func.__name__, e)
+                    raise
+
+            return cast(Callable[..., T], single_attempt)
+
+        @wraps(func, assigned=_WRAPPER_ASSIGNMENTS, updated=())
         def wrapper(*args: Any, **kwargs: Any) -> T:
             last_exception = None
 
@@ -58,7 +107,8 @@ def retry_with_exponential_backoff(
 
                     # If not the last attempt, wait with exponential backoff
                     if attempt < max_retries - 1:
-                        backoff_time = min(initial_backoff * (2**attempt), max_backoff)
+                        # Full jitter: desynchronize retries from callers that failed together
+                        backoff_time = _rng.uniform(0, backoff_schedule[attempt])
                         logger.info(f"Retrying {func.__name__} in {backoff_time:.1f} seconds...")
                         time.sleep(backoff_time)
 
@@ -109,7 +159,16 @@ async def async_retry_with_exponential_backoff(
             arg1="value"
         )
     """
-    import asyncio
+    if max_retries == 1:
+        # A single attempt has nothing to retry or back off from; only the failure logs remain
+        try:
+            return await func(*args, **kwargs)
+        except skip_exceptions as e:
+            logger.debug(f"Skipping retry for {type(e).__name__}: {str(e)}")
+            raise
+        except exceptions as e:
+            _log_single_attempt_failure(func.__name__, e)
+            raise
 
     last_exception = None
 
@@ -131,7 +190,8 @@ async def async_retry_with_exponential_backoff(
 
             # If not the last attempt, wait with exponential backoff
             if attempt < max_retries - 1:
-                backoff_time = min(initial_backoff * (2**attempt), max_backoff)
+                # Full jitter: desynchronize retries from callers that failed together
+                backoff_time = _rng.uniform(0, _backoff_schedule(max_retries, initial_backoff, max_backoff)[attempt])
                 logger.info(f"Retrying {func.__name__} in {backoff_time:.1f} seconds...")
                 await asyncio.sleep(backoff_time)
 
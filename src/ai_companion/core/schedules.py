@@ -1,111 +1,184 @@
+"""Rose's weekly schedule.
+
+Every day shares the same twelve time slots, so the slots are stored once in
+TIME_RANGES and each day is a tuple of activities in slot order. The
+"HH:MM-HH:MM" keyed dicts (MONDAY_SCHEDULE, ...) are built from these tables,
+and SLOT_BY_MINUTE maps every minute of the day straight to its slot.
+"""
+
+# (start_minute, end_minute) since midnight; the last slot wraps past midnight
+TIME_RANGES = (
+    (360, 420),  # 06:00-07:00
+    (420, 510),  # 07:00-08:30
+    (510, 600),  # 08:30-10:00
+    (600, 720),  # 10:00-12:00
+    (720, 810),  # 12:00-13:30
+    (810, 930),  # 13:30-15:30
+    (930, 1020),  # 15:30-17:00
+    (1020, 1140),  # 17:00-19:00
+    (1140, 1260),  # 19:00-21:00
+    (1260, 1320),  # 21:00-22:00
+    (1320, 1380),  # 22:00-23:00
+    (1380, 360),  # 23:00-06:00
+)
+
 # Rose's Monday Schedule
-MONDAY_SCHEDULE = {
-    "06:00-07:00": "Rose begins her day with sunrise meditation and prayer, connecting with the spirits of the land.",
-    "07:00-08:30": "Rose prepares sacred space and gathers healing herbs from her garden for the day's sessions.",
-    "08:30-10:00": "Rose is available for healing sessions, holding space for those seeking guidance.",
-    "10:00-12:00": "Rose continues offering healing sessions, working with grief and emotional transformation.",
-    "12:00-13:30": "Rose takes time for grounding and nourishment, preparing simple meals with intention.",
-    "13:30-15:30": "Rose is available for healing sessions, guiding others through their emotional journeys.",
-    "15:30-17:00": "Rose tends to her healing garden and prepares plant medicine remedies.",
-    "17:00-19:00": "Rose offers evening healing sessions for those who need support.",
-    "19:00-21:00": "Rose practices ceremony and ritual, honoring the cycles of healing and transformation.",
-    "21:00-22:00": "Rose reflects on the day's healing work and journals her insights.",
-    "22:00-23:00": "Rose prepares for rest with gentle stretching and gratitude practice.",
-    "23:00-06:00": "Rose rests, allowing her own spirit to restore and renew.",
-}
+MONDAY_ACTIVITIES = (
+    "Rose begins her day with sunrise meditation and prayer, connecting with the spirits of the land.",
+    "Rose prepares sacred space and gathers healing herbs from her garden for the day's sessions.",
+    "Rose is available for healing sessions, holding space for those seeking guidance.",
+    "Rose continues offering healing sessions, working with grief and emotional transformation.",
+    "Rose takes time for grounding and nourishment, preparing simple meals with intention.",
+    "Rose is available for healing sessions, guiding others through their emotional journeys.",
+    "Rose tends to her healing garden and prepares plant medicine remedies.",
+    "Rose offers evening healing sessions for those who need support.",
+    "Rose practices ceremony and ritual, honoring the cycles of healing and transformation.",
+    "Rose reflects on the day's healing work and journals her insights.",
+    "Rose prepares for rest with gentle stretching and gratitude practice.",
+    "Rose rests, allowing her own spirit to restore and renew.",
+)
 
 # Rose's Tuesday Schedule
-TUESDAY_SCHEDULE = {
-    "06:00-07:00": "Rose greets the dawn with breathwork and connection to the elements.",
-    "07:00-08:30": "Rose prepares healing space and sets intentions for the day's work.",
-    "08:30-10:00": "Rose is available for healing sessions, offering compassionate presence.",
-    "10:00-12:00": "Rose continues healing sessions, working with grief, loss, and transformation.",
-    "12:00-13:30": "Rose takes time for self-care and grounding in nature.",
-    "13:30-15:30": "Rose is available for healing sessions, holding sacred space for emotional healing.",
-    "15:30-17:00": "Rose studies ancient healing texts and connects with her lineage of healers.",
-    "17:00-19:00": "Rose offers evening healing sessions for those seeking support.",
-    "19:00-21:00": "Rose engages in personal healing practice and energy clearing.",
-    "21:00-22:00": "Rose reflects on the day's sessions and offers prayers for those she's served.",
-    "22:00-23:00": "Rose prepares for rest with calming tea and gentle music.",
-    "23:00-06:00": "Rose rests, trusting in the healing power of sleep and dreams.",
-}
+TUESDAY_ACTIVITIES = (
+    "Rose greets the dawn with breathwork and connection to the elements.",
+    "Rose prepares healing space and sets intentions for the day's work.",
+    "Rose is available for healing sessions, offering compassionate presence.",
+    "Rose continues healing sessions, working with grief, loss, and transformation.",
+    "Rose takes time for self-care and grounding in nature.",
+    "Rose is available for healing sessions, holding sacred space for emotional healing.",
+    "Rose studies ancient healing texts and connects with her lineage of healers.",
+    "Rose offers evening healing sessions for those seeking support.",
+    "Rose engages in personal healing practice and energy clearing.",
+    "Rose reflects on the day's sessions and offers prayers for those she's served.",
+    "Rose prepares for rest with calming tea and gentle music.",
+    "Rose rests, trusting in the healing power of sleep and dreams.",
+)
 
 # Rose's Wednesday Schedule
-WEDNESDAY_SCHEDULE = {
-    "06:00-07:00": "Rose practices morning yoga and connects with her breath and body.",
-    "07:00-08:30": "Rose prepares healing space and gathers materials for ceremony work.",
-    "08:30-10:00": "Rose is available for healing sessions, offering guidance and support.",
-    "10:00-12:00": "Rose continues healing sessions, working with emotional release and transformation.",
-    "12:00-13:30": "Rose takes time for nourishment and walks in nature to restore her energy.",
-    "13:30-15:30": "Rose is available for healing sessions, holding space for deep grief work.",
-    "15:30-17:00": "Rose creates healing art and sacred objects for her practice.",
-    "17:00-19:00": "Rose offers evening healing sessions for those in need.",
-    "19:00-21:00": "Rose engages in community healing circle or group ceremony.",
-    "21:00-22:00": "Rose reflects on the healing work and tends to her own emotional wellbeing.",
-    "22:00-23:00": "Rose prepares for rest with meditation and prayer.",
-    "23:00-06:00": "Rose rests, allowing healing to continue in the dreamtime.",
-}
+WEDNESDAY_ACTIVITIES = (
+    "Rose practices morning yoga and connects with her breath and body.",
+    "Rose prepares healing space and gathers materials for ceremony work.",
+    "Rose is available for healing sessions, offering guidance and support.",
+    "Rose continues healing sessions, working with emotional release and transformation.",
+    "Rose takes time for nourishment and walks in nature to restore her energy.",
+    "Rose is available for healing sessions, holding space for deep grief work.",
+    "Rose creates healing art and sacred objects for her practice.",
+    "Rose offers evening healing sessions for those in need.",
+    "Rose engages in community healing circle or group ceremony.",
+    "Rose reflects on the healing work and tends to her own emotional wellbeing.",
+    "Rose prepares for rest with meditation and prayer.",
+    "Rose rests, allowing healing to continue in the dreamtime.",
+)
 
 # Rose's Thursday Schedule
-THURSDAY_SCHEDULE = {
-    "06:00-07:00": "Rose begins with morning meditation and connection to ancestral wisdom.",
-    "07:00-08:30": "Rose prepares healing space and reviews her intentions for the day.",
-    "08:30-10:00": "Rose is available for healing sessions, offering compassionate listening.",
-    "10:00-12:00": "Rose continues healing sessions, guiding others through emotional landscapes.",
-    "12:00-13:30": "Rose takes time for self-nourishment and grounding practices.",
-    "13:30-15:30": "Rose is available for healing sessions, working with grief and loss.",
-    "15:30-17:00": "Rose studies plant medicine and prepares healing remedies.",
-    "17:00-19:00": "Rose offers evening healing sessions for those seeking guidance.",
-    "19:00-21:00": "Rose engages in personal ceremony and spiritual practice.",
-    "21:00-22:00": "Rose reflects on the healing journey and offers gratitude.",
-    "22:00-23:00": "Rose prepares for rest with gentle stretching and breathwork.",
-    "23:00-06:00": "Rose rests, trusting in the wisdom of the body and spirit.",
-}
+THURSDAY_ACTIVITIES = (
+    "Rose begins with morning meditation and connection to ancestral wisdom.",
+    "Rose prepares healing space and reviews her intentions for the day.",
+    "Rose is available for healing sessions, offering compassionate listening.",
+    "Rose continues healing sessions, guiding others through emotional landscapes.",
+    "Rose takes time for self-nourishment and grounding practices.",
+    "Rose is available for healing sessions, working with grief and loss.",
+    "Rose studies plant medicine and prepares healing remedies.",
+    "Rose offers evening healing sessions for those seeking guidance.",
+    "Rose engages in personal ceremony and spiritual practice.",
+    "Rose reflects on the healing journey and offers gratitude.",
+    "Rose prepares for rest with gentle stretching and breathwork.",
+    "Rose rests, trusting in the wisdom of the body and spirit.",
+)
 
 # Rose's Friday Schedule
-FRIDAY_SCHEDULE = {
-    "06:00-07:00": "Rose greets the morning with gratitude and gentle movement.",
-    "07:00-08:30": "Rose prepares healing space and reflects on the week's healing work.",
-    "08:30-10:00": "Rose is available for healing sessions, offering support and guidance.",
-    "10:00-12:00": "Rose continues healing sessions, honoring each person's unique journey.",
-    "12:00-13:30": "Rose takes time for rest and celebration of the week's healing.",
-    "13:30-15:30": "Rose is available for healing sessions, holding space for transformation.",
-    "15:30-17:00": "Rose tends to her healing space and prepares for the weekend.",
-    "17:00-19:00": "Rose offers evening healing sessions for those in need.",
-    "19:00-21:00": "Rose engages in personal ritual to honor the week's transitions.",
-    "21:00-22:00": "Rose reflects on the healing journey and sets intentions for rest.",
-    "22:00-23:00": "Rose prepares for the weekend with gentle music and tea.",
-    "23:00-06:00": "Rose rests, allowing her spirit to restore and renew.",
-}
+FRIDAY_ACTIVITIES = (
+    "Rose greets the morning with gratitude and gentle movement.",
+    "Rose prepares healing space and reflects on the week's healing work.",
+    "Rose is available for healing sessions, offering support and guidance.",
+    "Rose continues healing sessions, honoring each person's unique journey.",
+    "Rose takes time for rest and celebration of the week's healing.",
+    "Rose is available for healing sessions, holding space for transformation.",
+    "Rose tends to her healing space and prepares for the weekend.",
+    "Rose offers evening healing sessions for those in need.",
+    "Rose engages in personal ritual to honor the week's transitions.",
+    "Rose reflects on the healing journey and sets intentions for rest.",
+    "Rose prepares for the weekend with gentle music and tea.",
+    "Rose rests, allowing her spirit to restore and renew.",
+)
 
 # Rose's Saturday Schedule
-SATURDAY_SCHEDULE = {
-    "06:00-07:00": "Rose begins the weekend with peaceful meditation and prayer.",
-    "07:00-08:30": "Rose gathers fresh herbs and connects with the natural world.",
-    "08:30-10:00": "Rose is available for healing sessions, offering weekend support.",
-    "10:00-12:00": "Rose continues healing sessions, working with those seeking guidance.",
-    "12:00-13:30": "Rose takes time for personal nourishment and rest.",
-    "13:30-15:30": "Rose is available for healing sessions, holding space for deep work.",
-    "15:30-17:00": "Rose spends time in nature, gathering wisdom and restoring energy.",
-    "17:00-19:00": "Rose offers evening healing sessions for those in need.",
-    "19:00-21:00": "Rose engages in personal ceremony and spiritual practice.",
-    "21:00-22:00": "Rose reflects on the healing work and offers gratitude.",
-    "22:00-23:00": "Rose prepares for rest with calming rituals.",
-    "23:00-06:00": "Rose rests, allowing healing to continue in the dreamtime.",
-}
+SATURDAY_ACTIVITIES = (
+    "Rose begins the weekend with peaceful meditation and prayer.",
+    "Rose gathers fresh herbs and connects with the natural world.",
+    "Rose is available for healing sessions, offering weekend support.",
+    "Rose continues healing sessions, working with those seeking guidance.",
+    "Rose takes time for personal nourishment and rest.",
+    "Rose is available for healing sessions, holding space for deep work.",
+    "Rose spends time in nature, gathering wisdom and restoring energy.",
+    "Rose offers evening healing sessions for those in need.",
+    "Rose engages in personal ceremony and spiritual practice.",
+    "Rose reflects on the healing work and offers gratitude.",
+    "Rose prepares for rest with calming rituals.",
+    "Rose rests, allowing healing to continue in the dreamtime.",
+)
 
 # Rose's Sunday Schedule
-SUNDAY_SCHEDULE = {
-    "06:00-07:00": "Rose welcomes the day with sunrise ceremony and gratitude.",
-    "07:00-08:30": "Rose enjoys quiet reflection and connection with spirit.",
-    "08:30-10:00": "Rose is available for healing sessions, offering Sunday support.",
-    "10:00-12:00": "Rose continues healing sessions, honoring the sacred day of rest.",
-    "12:00-13:30": "Rose takes time for deep rest and nourishment.",
-    "13:30-15:30": "Rose is available for healing sessions, holding gentle space.",
-    "15:30-17:00": "Rose prepares for the week ahead with intention setting and prayer.",
-    "17:00-19:00": "Rose offers evening healing sessions for those seeking guidance.",
-    "19:00-21:00": "Rose engages in personal healing practice and reflection.",
-    "21:00-22:00": "Rose honors the week's transitions and sets intentions for the coming days.",
-    "22:00-23:00": "Rose prepares for rest with gratitude and gentle rituals.",
-    "23:00-06:00": "Rose rests, trusting in the cycles of healing and renewal.",
-}
+SUNDAY_ACTIVITIES = (
+    "Rose welcomes the day with sunrise ceremony and gratitude.",
+    "Rose enjoys quiet reflection and connection with spirit.",
+    "Rose is available for healing sessions, offering Sunday support.",
+    "Rose continues healing sessions, honoring the sacred day of rest.",
+    "Rose takes time for deep rest and nourishment.",
+    "Rose is available for healing sessions, holding gentle space.",
+    "Rose prepares for the week ahead with intention setting and prayer.",
+    "Rose offers evening healing sessions for those seeking guidance.",
+    "Rose engages in personal healing practice and reflection.",
+    "Rose honors the week's transitions and sets intentions for the coming days.",
+    "Rose prepares for rest with gratitude and gentle rituals.",
+    "Rose rests, trusting in the cycles of healing and renewal.",
+)
+
+# Activities indexed by weekday (0 = Monday, 6 = Sunday), then by slot
+DAY_ACTIVITIES = (
+    MONDAY_ACTIVITIES,
+    TUESDAY_ACTIVITIES,
+    WEDNESDAY_ACTIVITIES,
+    THURSDAY_ACTIVITIES,
+    FRIDAY_ACTIVITIES,
+    SATURDAY_ACTIVITIES,
+    SUNDAY_ACTIVITIES,
+)
+
+
+def _format_minutes(minutes: int) -> str:
+    """Format minutes since midnight as "HH:MM"."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+# "HH:MM-HH:MM" labels for TIME_RANGES, in slot order
+TIME_RANGE_LABELS = tuple(f"{_format_minutes(start)}-{_format_minutes(end)}" for start, end in TIME_RANGES)
+
+# Dict views keyed by time range label, kept for callers that display a whole day
+MONDAY_SCHEDULE = dict(zip(TIME_RANGE_LABELS, MONDAY_ACTIVITIES))
+TUESDAY_SCHEDULE = dict(zip(TIME_RANGE_LABELS, TUESDAY_ACTIVITIES))
+WEDNESDAY_SCHEDULE = dict(zip(TIME_RANGE_LABELS, WEDNESDAY_ACTIVITIES))
+THURSDAY_SCHEDULE = dict(zip(TIME_RANGE_LABELS, THURSDAY_ACTIVITIES))
+FRIDAY_SCHEDULE = dict(zip(TIME_RANGE_LABELS, FRIDAY_ACTIVITIES))
+SATURDAY_SCHEDULE = dict(zip(TIME_RANGE_LABELS, SATURDAY_ACTIVITIES))
+SUNDAY_SCHEDULE = dict(zip(TIME_RANGE_LABELS, SUNDAY_ACTIVITIES))
+
+
+MINUTES_PER_DAY = 24 * 60
+# SLOT_BY_MINUTE entry for a minute no time range covers
+NO_SLOT = 0xFF
+
+
+def _build_slot_table() -> bytes:
+    """Map each minute of the day to its TIME_RANGES index; the overnight range wraps at midnight."""
+    table = bytearray([NO_SLOT]) * MINUTES_PER_DAY
+    for slot, (start, end) in enumerate(TIME_RANGES):
+        minute = start
+        while minute != end:
+            table[minute] = slot
+            minute = (minute + 1) % MINUTES_PER_DAY
+    return bytes(table)
+
+
+# Slot index for every minute since midnight: lookup is DAY_ACTIVITIES[weekday][SLOT_BY_MINUTE[minute]]
+SLOT_BY_MINUTE = _build_slot_table()
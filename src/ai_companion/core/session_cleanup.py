@@ -1,6 +1,7 @@
 """Session cleanup utilities for managing old session data."""
 
 import sqlite3
+import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -10,6 +11,41 @@ from ai_companion.settings import settings
 
 logger = get_logger(__name__)
 
+# Thread IDs per DELETE statement; stays well under SQLITE_MAX_VARIABLE_NUMBER (999 on older builds)
+# and keeps each write lock short so the checkpointer is not blocked for the whole cleanup
+DELETE_BATCH_SIZE = 500
+
+# Thread IDs with no checkpoint newer than the cutoff parameter. One grouped pass over the
+# (thread_id, checkpoint_id) index returns only stale threads; nothing is probed per row.
+_STALE_THREADS_SQL = """
+    SELECT thread_id FROM checkpoints
+    GROUP BY thread_id
+    HAVING MAX(checkpoint_id) <= ?
+"""
+
+# 100-ns intervals between the UUID epoch (1582-10-15) and the Unix epoch
+_UUID_EPOCH_OFFSET = 0x01B21DD213814000
+
+
+def checkpoint_id_floor(moment: datetime) -> str:
+    """Return the smallest LangGraph checkpoint_id that could be created at ``moment``.
+
+    LangGraph checkpoint IDs are UUIDv6 strings, whose leading hex digits are the creation
+    time, most significant first. Comparing ``checkpoint_id`` against this bound as text
+    therefore filters by age directly on the indexed column.
+
+    Args:
+        moment: Point in time to convert (naive values are treated as local time)
+
+    Returns:
+        str: UUIDv6 string with the timestamp of ``moment`` and zeroed clock sequence and node
+    """
+    timestamp = int(moment.timestamp() * 10_000_000) + _UUID_EPOCH_OFFSET
+    uuid_int = ((timestamp >> 12) & 0xFFFFFFFFFFFF) << 80 | (timestamp & 0x0FFF) << 64
+    # Version 6 and RFC 4122 variant bits; the stdlib UUID only sets these for versions 1-5
+    uuid_int |= 0x6 << 76 | 0x8 << 60
+    return str(uuid.UUID(int=uuid_int))
+
 
 class SessionCleanupManager:
     """Manager for cleaning up old session data from SQLite checkpointer."""
@@ -22,6 +58,39 @@ class SessionCleanupManager:
         """
         self.db_path = db_path or settings.SHORT_TERM_MEMORY_DB_PATH
 
+    def _reclaim_space(self, conn: sqlite3.Connection) -> None:
+        """Return pages freed by the deletes to the filesystem.
+
+        LangGraph creates its database without auto_vacuum, so deleted pages stay on the
+        freelist and the file never shrinks. Databases in incremental mode are trimmed with
+        PRAGMA incremental_vacuum. Otherwise, if SESSION_CLEANUP_FULL_VACUUM is set, a single
+        full VACUUM rewrites the file and switches it to incremental mode for later runs.
+
+        Args:
+            conn: Open connection with no pending transaction
+        """
+        freelist_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+        if auto_vacuum == 2:  # INCREMENTAL
+            # Each result row is one step; the pragma only frees pages as rows are fetched
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+            method = "incremental_vacuum"
+        elif settings.SESSION_CLEANUP_FULL_VACUUM:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+            method = "vacuum"
+        else:
+            logger.info("session_cleanup_vacuum_skipped", reason="auto_vacuum_disabled", free_pages=freelist_before)
+            return
+
+        logger.info(
+            "session_cleanup_vacuum_completed",
+            method=method,
+            free_pages_before=freelist_before,
+            free_pages_after=conn.execute("PRAGMA freelist_count").fetchone()[0],
+        )
+
     def cleanup_old_sessions(self, retention_days: Optional[int] = None) -> Dict[str, Any]:
         """Clean up sessions older than specified retention period.
 
@@ -44,6 +113,9 @@ class SessionCleanupManager:
 
         try:
             conn = sqlite3.connect(self.db_path)
+            # WAL lets readers proceed during the deletes; NORMAL skips the fsync on every commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
             cursor = conn.cursor()
 
             # Check if checkpoints table exists (LangGraph creates this)
@@ -63,16 +135,12 @@ class SessionCleanupManager:
 
             # LangGraph checkpoints table typically has: thread_id, checkpoint_ns, checkpoint_id,
             # parent_checkpoint_id, type, checkpoint, metadata
-            # We'll use checkpoint_id which contains timestamp information
+            # checkpoint_id is a UUIDv6, so it sorts by creation time (metadata carries no timestamp)
 
             if "checkpoint_id" in columns and "metadata" in columns:
-                # Count sessions before cleanup
-                cursor.execute("SELECT COUNT(DISTINCT thread_id) FROM checkpoints")
-                sessions_before = cursor.fetchone()[0]
-
-                # Count checkpoints before cleanup
-                cursor.execute("SELECT COUNT(*) FROM checkpoints")
-                checkpoints_before = cursor.fetchone()[0]
+                # Count checkpoints and sessions before cleanup in one scan
+                cursor.execute("SELECT COUNT(*), COUNT(DISTINCT thread_id) FROM checkpoints")
+                checkpoints_before, sessions_before = cursor.fetchone()
 
                 logger.info(
                     "session_cleanup_analysis",
@@ -82,49 +150,34 @@ class SessionCleanupManager:
                     cutoff_date=cutoff_date.isoformat(),
                 )
 
-                # LangGraph checkpoint_id format is typically a timestamp-based UUID
-                # We'll identify old sessions by finding thread_ids where ALL checkpoints
-                # are older than the cutoff date
-
-                # First, find thread_ids that have at least one recent checkpoint
-                # (these are active sessions we want to keep)
-                cursor.execute(
-                    """
-                    SELECT DISTINCT thread_id
-                    FROM checkpoints
-                    WHERE checkpoint_id > ?
-                """,
-                    (cutoff_date.timestamp(),),
-                )
-
-                active_thread_ids = {row[0] for row in cursor.fetchall()}
-
-                # Now find all thread_ids
-                cursor.execute("SELECT DISTINCT thread_id FROM checkpoints")
-                all_thread_ids = {row[0] for row in cursor.fetchall()}
+                # A session is stale when none of its checkpoints is newer than the cutoff.
+                # Only stale thread IDs are returned, in a single pass over the primary key index.
+                cursor.execute(_STALE_THREADS_SQL, (checkpoint_id_floor(cutoff_date),))
+                stale_thread_ids = [row[0] for row in cursor]
 
-                # Thread IDs to delete are those with no recent activity
-                thread_ids_to_delete = all_thread_ids - active_thread_ids
-
-                if thread_ids_to_delete:
-                    # Delete checkpoints for old sessions
-                    placeholders = ",".join("?" * len(thread_ids_to_delete))
-                    cursor.execute(
-                        f"DELETE FROM checkpoints WHERE thread_id IN ({placeholders})",
-                        tuple(thread_ids_to_delete),
-                    )
+                if stale_thread_ids:
+                    # Delete checkpoints for old sessions in bounded batches, committing between
+                    # batches so no single transaction grows with the backlog. One prepared
+                    # statement is re-executed per thread, each an index probe.
+                    for i in range(0, len(stale_thread_ids), DELETE_BATCH_SIZE):
+                        batch = stale_thread_ids[i : i + DELETE_BATCH_SIZE]
+                        cursor.executemany(
+                            "DELETE FROM checkpoints WHERE thread_id = ?", [(thread_id,) for thread_id in batch]
+                        )
+                        stats["checkpoints_deleted"] += cursor.rowcount
+                        conn.commit()
 
-                    stats["checkpoints_deleted"] = cursor.rowcount
-                    stats["sessions_deleted"] = len(thread_ids_to_delete)
+                    stats["sessions_deleted"] = len(stale_thread_ids)
 
-                    conn.commit()
+                    if stats["checkpoints_deleted"] >= settings.SESSION_CLEANUP_VACUUM_THRESHOLD:
+                        self._reclaim_space(conn)
 
                     logger.info(
                         "session_cleanup_completed",
                         sessions_deleted=stats["sessions_deleted"],
                         checkpoints_deleted=stats["checkpoints_deleted"],
                         sessions_remaining=sessions_before - stats["sessions_deleted"],
-                        thread_ids_deleted=list(thread_ids_to_delete)[:5],  # Log first 5 for debugging
+                        thread_ids_deleted=stale_thread_ids[:5],  # Log first 5 for debugging
                     )
                 else:
                     logger.info(
@@ -34,11 +34,13 @@ def create_workflow_graph() -> StateGraph:
     graph_builder.add_node("audio_node", audio_node)
     graph_builder.add_node("summarize_conversation_node", summarize_conversation_node)
 
-    # Flow: extract memories → inject context → inject memories → generate audio response
-    graph_builder.add_edge(START, "memory_extraction_node")
-    graph_builder.add_edge("memory_extraction_node", "context_injection_node")
-    graph_builder.add_edge("context_injection_node", "memory_injection_node")
-    graph_builder.add_edge("memory_injection_node", "audio_node")
+    # Flow: extract memories, inject context and inject memories in parallel → generate audio response.
+    # The three nodes write disjoint state keys, so their updates merge without reducers;
+    # audio_node waits for all of them, and the Qdrant search no longer waits on the others
+    prepare_nodes = ["memory_extraction_node", "context_injection_node", "memory_injection_node"]
+    for node in prepare_nodes:
+        graph_builder.add_edge(START, node)
+    graph_builder.add_edge(prepare_nodes, "audio_node")
 
     # Summarize if conversation history exceeds threshold
     graph_builder.add_conditional_edges("audio_node", should_summarize_conversation)
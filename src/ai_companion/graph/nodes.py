@@ -23,25 +23,111 @@ Example:
 """
 
 import asyncio
-from typing import Any
+import re
+import threading
+from collections import deque
+from itertools import islice
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import Runnable, RunnableConfig
+from langgraph.types import StreamWriter
 
 from ai_companion.core.logging_config import get_logger
 from ai_companion.graph.state import AICompanionState
-from ai_companion.graph.utils.chains import get_character_response_chain
+from ai_companion.graph.utils.chains import format_summary_context, get_character_response_chain
 from ai_companion.graph.utils.helpers import (
     get_chat_model,
     get_text_to_speech_module,
     node_wrapper,
+    remove_asterisk_content,
 )
-from ai_companion.modules.memory.long_term.memory_manager import get_memory_manager
 from ai_companion.modules.schedules.context_generation import ScheduleContextGenerator
 from ai_companion.settings import settings
 
+if TYPE_CHECKING:
+    from ai_companion.modules.memory.long_term.memory_manager import MemoryManager
+
 logger = get_logger(__name__)
 
+_message_id = attrgetter("id")
+
+# Reply used when the conversation chain fails
+CONVERSATION_FALLBACK_TEXT = "I'm having trouble processing that right now. Could you try asking in a different way?"
+
+# Upper bound on workers running memory extractions; each turn's extraction waits in a bounded backlog
+MEMORY_EXTRACTION_WORKERS = 8
+# Extractions waiting for a worker; when full, new ones are dropped rather than piling up
+MEMORY_EXTRACTION_QUEUE_SIZE = 256
+_pending_extractions: deque[tuple[Any, str | None]] = deque()
+# Strong references to running workers; the event loop only keeps weak ones
+_background_tasks: set[asyncio.Task[None]] = set()
+
+# Messages from the end of the history used as the long-term memory query
+MEMORY_CONTEXT_MESSAGES = 3
+# Upper bound on the memory query; embedding time grows with input length, and
+# all-MiniLM-L6-v2 truncates past 256 word pieces (~1k chars), dropping the newest text
+MEMORY_CONTEXT_MAX_CHARS = 1024
+# Upper bound on memory lookups holding a thread. A lookup that outlives its time budget
+# keeps running, so without a cap a slow Qdrant would fill the shared default executor
+MEMORY_RETRIEVAL_WORKERS = 4
+# Released by the worker thread when its lookup finishes, so it must be thread-safe
+_memory_retrieval_slots = threading.BoundedSemaphore(MEMORY_RETRIEVAL_WORKERS)
+
+# Sentences synthesized at once while streaming; ElevenLabs plans cap concurrent requests
+TTS_SENTENCE_CONCURRENCY = 3
+
+# End of a sentence in streamed LLM output: terminal punctuation followed by whitespace
+_SENTENCE_END = re.compile(r"[.!?]+\s")
+
+
+def get_memory_manager() -> "MemoryManager":
+    """Return the shared memory manager.
+
+    Imported on first call: the memory stack pulls in the Qdrant client and the
+    embedding model, which graph compilation and tooling never need.
+    """
+    from ai_companion.modules.memory.long_term.memory_manager import get_memory_manager as _get_memory_manager
+
+    return _get_memory_manager()
+
+
+def _thread_id(config: RunnableConfig | None) -> str | None:
+    """Return the LangGraph thread id (the session id) from a runnable config, if any."""
+    if not config:
+        return None
+    configurable = config.get("configurable")
+    return configurable.get("thread_id") if configurable else None
+
+
+def _message_text(message: Any) -> str:
+    """Return the plain text of a message, including multimodal list-of-parts content."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    texts = (part if isinstance(part, str) else part.get("text") for part in content if isinstance(part, (str, dict)))
+    return " ".join(text for text in texts if text)
+
+
+def _recent_context(messages: list[Any]) -> str:
+    """Join the text of the most recent messages, newest kept first when the cap is hit.
+
+    Blank messages and exact repeats (e.g. a retried utterance) add nothing to the query and are skipped.
+    """
+    parts: list[str] = []
+    total = 0
+    for message in islice(reversed(messages), MEMORY_CONTEXT_MESSAGES):
+        text = _message_text(message).strip()
+        if not text or text in parts:
+            continue
+        parts.append(text)
+        total += len(text)
+        if total >= MEMORY_CONTEXT_MAX_CHARS:
+            break
+    parts.reverse()
+    return " ".join(parts)[-MEMORY_CONTEXT_MAX_CHARS:]
+
 
 def context_injection_node(state: AICompanionState) -> dict[str, bool | str]:
     """Inject current activity context into the conversation state.
@@ -80,10 +166,10 @@ async def conversation_node(state: AICompanionState, config: RunnableConfig) ->
     Returns:
         Dictionary with AI response: {"messages": AIMessage}
     """
-    current_activity = ScheduleContextGenerator.get_current_activity()
+    current_activity = state.get("current_activity") or ScheduleContextGenerator.get_current_activity()
     memory_context = state.get("memory_context", "")
 
-    chain = get_character_response_chain(state.get("summary", ""))
+    chain = get_character_response_chain()
 
     try:
         response = await chain.ainvoke(
@@ -91,27 +177,143 @@ async def conversation_node(state: AICompanionState, config: RunnableConfig) ->
                 "messages": state["messages"],
                 "current_activity": current_activity,
                 "memory_context": memory_context,
+                "summary_context": format_summary_context(state.get("summary", "")),
             },
             config,
         )
     except Exception as e:
         # Return a gentle fallback message instead of failing the entire workflow
         logger.exception("❌ conversation chain invocation failed; returning fallback message")
-        fallback_text = "I'm having trouble processing that right now. Could you try asking in a different way?"
-        return {"messages": AIMessage(content=fallback_text)}
+        # A fresh message each time: add_messages stamps an id onto the instance it receives,
+        # so a shared AIMessage would make a second fallback replace the first in history
+        return {"messages": AIMessage(content=CONVERSATION_FALLBACK_TEXT)}
 
     return {"messages": AIMessage(content=response)}
 
 
+def _complete_sentences_end(buffer: str) -> int:
+    """Return the index after the last complete sentence in buffer, or 0 if there is none.
+
+    A boundary inside an unclosed *stage direction* is skipped so the direction is
+    removed as a whole rather than split across two TTS segments.
+    """
+    for match in reversed(list(_SENTENCE_END.finditer(buffer))):
+        if buffer.count("*", 0, match.end()) % 2 == 0:
+            return match.end()
+    return 0
+
+
+def _discard_stream_event(_event: Any) -> None:
+    """Stream writer used when audio_node is called outside a streaming graph run."""
+
+
+async def _stream_response_with_tts(
+    chain: Runnable[dict[str, Any], str],
+    inputs: dict[str, Any],
+    config: RunnableConfig,
+    text_to_speech_module: Any,
+    writer: StreamWriter = _discard_stream_event,
+) -> tuple[bytes | None, str]:
+    """Stream the LLM response and synthesize each sentence while later ones are decoded.
+
+    Each complete sentence starts its own TTS request as soon as it arrives, up to
+    TTS_SENTENCE_CONCURRENCY at a time, so synthesis overlaps with generation and
+    a slow sentence does not hold back the ones after it. Finished segments are
+    emitted in order through writer as {"audio_chunk": bytes}, until a segment fails.
+    From the first failed sentence onward, the rest of the reply is synthesized in
+    one request and emitted after them, so the emitted chunks are always the start
+    of the returned audio.
+
+    Returns:
+        Tuple of (audio bytes or None, response text or its text-only fallback)
+    """
+    slots = asyncio.Semaphore(TTS_SENTENCE_CONCURRENCY)
+
+    async def synthesize(sentence: str) -> bytes | None:
+        async with slots:
+            audio, _ = await text_to_speech_module.synthesize_with_fallback(sentence)
+        return audio
+
+    # Kept in sentence order, so the audio plays in order whatever finishes first
+    tasks: list[asyncio.Task[bytes | None]] = []
+    pending: asyncio.Queue[asyncio.Task[bytes | None] | None] = asyncio.Queue()
+    segments: list[bytes | None] = []
+    sentences: list[str] = []
+
+    async def emit_in_order() -> None:
+        while (task := await pending.get()) is not None:
+            audio = await task
+            # After a failed segment the rest of the reply is resynthesized as a whole, so later audio is not emitted
+            if audio is not None and None not in segments:
+                writer({"audio_chunk": audio})
+            segments.append(audio)
+
+    def dispatch(text: str) -> None:
+        sentence = remove_asterisk_content(text)
+        if sentence:
+            sentences.append(sentence)
+            task = asyncio.create_task(synthesize(sentence))
+            tasks.append(task)
+            pending.put_nowait(task)
+
+    emitter = asyncio.create_task(emit_in_order())
+    chunks: list[str] = []
+    buffer = ""
+    try:
+        async for chunk in chain.astream(inputs, config):
+            chunks.append(chunk)
+            buffer += chunk
+            if end := _complete_sentences_end(buffer):
+                dispatch(buffer[:end])
+                buffer = buffer[end:]
+        dispatch(buffer)
+        pending.put_nowait(None)
+        await emitter
+    except BaseException:
+        emitter.cancel()
+        for task in tasks:
+            task.cancel()
+        raise
+
+    response = remove_asterisk_content("".join(chunks))
+    if not segments:
+        # Nothing to synthesize: let the TTS module decide the text-only reply, as the serial path does
+        return await text_to_speech_module.synthesize_with_fallback(response)
+
+    # Sentences before the first failure have already been emitted; keep them
+    spoken = next((i for i, audio in enumerate(segments) if audio is None), len(segments))
+    # ElevenLabs returns MP3, whose frames can be concatenated as-is
+    spoken_audio = b"".join(audio for audio in segments[:spoken] if audio is not None)
+    if spoken == len(segments):
+        return spoken_audio, response
+
+    tail = " ".join(sentences[spoken:]) if spoken else response
+    tail_audio, tail_text = await text_to_speech_module.synthesize_with_fallback(tail)
+    if tail_audio is not None:
+        writer({"audio_chunk": tail_audio})
+        return spoken_audio + tail_audio, response
+    if not spoken:
+        return None, tail_text
+
+    # The voice gave out mid-reply: the audio is what was already spoken, the text carries the rest
+    return spoken_audio, " ".join([*sentences[:spoken], tail_text])
+
+
 @node_wrapper
-async def audio_node(state: AICompanionState, config: RunnableConfig) -> dict[str, str | bytes]:
+async def audio_node(
+    state: AICompanionState, config: RunnableConfig, writer: StreamWriter = _discard_stream_event
+) -> dict[str, str | bytes]:
     """Generate a voice response with audio output.
 
-    Creates a text response and synthesizes it to audio using TTS.
+    Creates a text response and synthesizes it to audio using TTS. With sentence
+    streaming enabled, each sentence is synthesized while the rest is still decoding,
+    and graph runs with stream_mode="custom" receive each sentence's audio as
+    {"audio_chunk": bytes} as soon as it is ready.
 
     Args:
         state: Current conversation state
         config: LangGraph runnable configuration
+        writer: LangGraph stream writer (injected by the graph)
 
     Returns:
         Dictionary with response and audio: {
@@ -119,21 +321,31 @@ async def audio_node(state: AICompanionState, config: RunnableConfig) -> dict[st
             "audio_buffer": bytes
         }
     """
-    current_activity = ScheduleContextGenerator.get_current_activity()
+    # context_injection_node has already looked the activity up for this turn
+    current_activity = state.get("current_activity") or ScheduleContextGenerator.get_current_activity()
     memory_context = state.get("memory_context", "")
 
-    chain = get_character_response_chain(state.get("summary", ""))
+    chain = get_character_response_chain()
     text_to_speech_module = get_text_to_speech_module()
+    inputs = {
+        "messages": state["messages"],
+        "current_activity": current_activity,
+        "memory_context": memory_context,
+        "summary_context": format_summary_context(state.get("summary", "")),
+    }
+
+    if settings.FEATURE_TTS_SENTENCE_STREAMING_ENABLED:
+        try:
+            audio_bytes, text_fallback = await _stream_response_with_tts(
+                chain, inputs, config, text_to_speech_module, writer
+            )
+        except Exception:
+            logger.exception("❌ streamed response failed in audio_node")
+            raise
+        return {"messages": AIMessage(content=text_fallback), "audio_buffer": audio_bytes}
 
     try:
-        response = await chain.ainvoke(
-            {
-                "messages": state["messages"],
-                "current_activity": current_activity,
-                "memory_context": memory_context,
-            },
-            config,
-        )
+        response = await chain.ainvoke(inputs, config)
     except Exception:
         logger.exception("❌ conversation chain invocation failed in audio_node")
         raise
@@ -188,7 +400,12 @@ async def summarize_conversation_node(state: AICompanionState) -> dict[str, str
         # Preserve the existing summary and avoid deleting current messages
         return {"summary": summary, "messages": []}
 
-    delete_messages = [RemoveMessage(id=m.id) for m in state["messages"][: -settings.TOTAL_MESSAGES_AFTER_SUMMARY]]
+    # Ids are read through islice so the kept tail is never copied into a throwaway slice
+    # As with the messages[:-keep] slice this replaces, a keep count of 0 removes nothing
+    history = state["messages"]
+    keep = settings.TOTAL_MESSAGES_AFTER_SUMMARY
+    remove_count = max(len(history) - keep, 0) if keep > 0 else 0
+    delete_messages = [RemoveMessage(id=message_id) for message_id in map(_message_id, islice(history, remove_count))]
     return {"summary": response.content, "messages": delete_messages}
 
 
@@ -211,13 +428,44 @@ async def _extract_memories_background(message: Any, session_id: str | None) ->
         logger.warning(f"⚠️ Background memory extraction failed: {e}", exc_info=True)
 
 
+async def _memory_extraction_worker() -> None:
+    """Run pending memory extractions until the backlog is empty, then exit."""
+    task = asyncio.current_task()
+    assert task is not None
+    try:
+        while _pending_extractions:
+            message, session_id = _pending_extractions.popleft()
+            await _extract_memories_background(message, session_id)
+    finally:
+        # Deregister before returning, with no await after the empty check, so a
+        # concurrent _queue_memory_extraction never counts a worker that is exiting
+        _background_tasks.discard(task)
+
+
+def _queue_memory_extraction(message: Any, session_id: str | None) -> bool:
+    """Add an extraction to the backlog, starting a worker if fewer than the maximum are running.
+
+    Workers only live while there is work, so nothing is left pending when the event loop stops.
+
+    Returns:
+        bool: False if the backlog is full and the extraction was dropped
+    """
+    if len(_pending_extractions) >= MEMORY_EXTRACTION_QUEUE_SIZE:
+        return False
+    _pending_extractions.append((message, session_id))
+    if len(_background_tasks) < MEMORY_EXTRACTION_WORKERS:
+        task = asyncio.create_task(_memory_extraction_worker(), name="memory_extraction_worker")
+        _background_tasks.add(task)
+    return True
+
+
 @node_wrapper
 async def memory_extraction_node(state: AICompanionState, config: RunnableConfig) -> dict[str, Any]:
     """Extract and store important information from the last message (non-blocking).
 
     Phase 1 Optimization: Memory extraction is now fire-and-forget.
-    This node spawns a background task and returns immediately,
-    reducing the critical path latency by ~100-200ms.
+    This node queues the message for a background worker and returns
+    immediately, reducing the critical path latency by ~100-200ms.
 
     The background task:
     - Analyzes the most recent message for important information
@@ -231,34 +479,59 @@ async def memory_extraction_node(state: AICompanionState, config: RunnableConfig
     Returns:
         Empty dictionary (proceeds immediately without waiting for extraction)
     """
-    if not state["messages"]:
+    if not settings.FEATURE_LONG_TERM_MEMORY_ENABLED or not state["messages"]:
         return {}
 
     try:
         # Extract session_id from config for memory isolation
-        session_id = config.get("configurable", {}).get("thread_id") if config else None
+        session_id = _thread_id(config)
         message = state["messages"][-1]
 
-        # Fire-and-forget: spawn background task and return immediately
+        # Fire-and-forget: queue the extraction for a background worker and return immediately
         # This reduces critical path latency while still storing memories
-        asyncio.create_task(
-            _extract_memories_background(message, session_id),
-            name=f"memory_extraction_{session_id or 'unknown'}"
-        )
-        logger.debug("memory_extraction_task_spawned", session_id=session_id)
+        if _queue_memory_extraction(message, session_id):
+            logger.debug("memory_extraction_queued", session_id=session_id)
+        else:
+            # Workers are behind (e.g. Qdrant is slow); skip this turn rather than grow without bound
+            logger.warning("memory_extraction_dropped_backlog_full", session_id=session_id)
     except Exception as e:
-        # Even task creation failure should not break the workflow
-        logger.warning(f"⚠️ Failed to spawn memory extraction task: {e}", exc_info=True)
+        # Even queueing failure should not break the workflow
+        logger.warning(f"⚠️ Failed to queue memory extraction: {e}", exc_info=True)
     
     return {}
 
 
+def _retrieve_memory_context(recent_context: str, session_id: str | None) -> str:
+    """Search long-term memory and format the hits for the prompt (blocking)."""
+    memory_manager = get_memory_manager()
+
+    try:
+        memories = memory_manager.get_relevant_memories(recent_context, session_id=session_id)
+    except Exception as e:
+        logger.warning(f"⚠️ Long-term memory retrieval failed: {e}", exc_info=True)
+        memories = []
+
+    return memory_manager.format_memories_for_prompt(memories)
+
+
+def _retrieve_memory_context_in_slot(recent_context: str, session_id: str | None) -> str:
+    """Run _retrieve_memory_context, then give back the retrieval slot taken by the caller."""
+    try:
+        return _retrieve_memory_context(recent_context, session_id)
+    finally:
+        _memory_retrieval_slots.release()
+
+
 @node_wrapper
-def memory_injection_node(state: AICompanionState, config: RunnableConfig) -> dict[str, str]:
+async def memory_injection_node(state: AICompanionState, config: RunnableConfig) -> dict[str, str]:
     """Retrieve and inject relevant memories into the character card.
 
     Searches long-term memory for relevant context based on recent
-    conversation and formats it for inclusion in the prompt.
+    conversation and formats it for inclusion in the prompt. The lookup
+    gets MEMORY_RETRIEVAL_TIMEOUT_SECONDS; past that the turn continues
+    without memories rather than waiting on a slow Qdrant. The timeout does
+    not stop the search thread, so at most MEMORY_RETRIEVAL_WORKERS lookups
+    run at once; while they are all busy, turns skip retrieval.
 
     Args:
         state: Current conversation state
@@ -267,20 +540,33 @@ def memory_injection_node(state: AICompanionState, config: RunnableConfig) -> di
     Returns:
         Dictionary with memory context: {"memory_context": str}
     """
-    memory_manager = get_memory_manager()
+    if not settings.FEATURE_LONG_TERM_MEMORY_ENABLED:
+        return {"memory_context": ""}
+
+    # Nothing to search with (first turn, or only blank messages): skip the embedding and Qdrant round-trip
+    recent_context = _recent_context(state.get("messages", []))
+    if not recent_context:
+        return {"memory_context": ""}
 
     # Extract session_id from config for memory isolation
-    session_id = config.get("configurable", {}).get("thread_id") if config else None
+    session_id = _thread_id(config)
 
-    # Get relevant memories based on recent conversation
-    recent_context = " ".join([m.content for m in state["messages"][-3:]])
-    try:
-        memories = memory_manager.get_relevant_memories(recent_context, session_id=session_id)
-    except Exception as e:
-        logger.warning(f"⚠️ Long-term memory retrieval failed: {e}", exc_info=True)
-        memories = []
+    if not _memory_retrieval_slots.acquire(blocking=False):
+        logger.warning("memory_retrieval_saturated", workers=MEMORY_RETRIEVAL_WORKERS, session_id=session_id)
+        return {"memory_context": ""}
 
-    # Format memories for the character card
-    memory_context = memory_manager.format_memories_for_prompt(memories)
+    try:
+        # Shielded so the lookup always reaches the thread that releases the slot, even on cancellation
+        memory_context = await asyncio.wait_for(
+            asyncio.shield(asyncio.to_thread(_retrieve_memory_context_in_slot, recent_context, session_id)),
+            timeout=settings.MEMORY_RETRIEVAL_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "memory_retrieval_timed_out",
+            timeout_seconds=settings.MEMORY_RETRIEVAL_TIMEOUT_SECONDS,
+            session_id=session_id,
+        )
+        memory_context = ""
 
     return {"memory_context": memory_context}
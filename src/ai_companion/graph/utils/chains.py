@@ -4,36 +4,57 @@ This module provides the character response chain for generating
 Rose's therapeutic voice responses.
 """
 
+from functools import lru_cache
 from typing import Any
 
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.runnables import Runnable
 
-from ai_companion.core.prompts import CHARACTER_CARD_PROMPT
+from ai_companion.core.prompts import CHARACTER_CARD_PROMPT, TURN_CONTEXT_PROMPT
 from ai_companion.graph.utils.helpers import AsteriskRemovalParser, get_chat_model
 
+# Filled at invoke time, so one chain serves every summary
+SUMMARY_PROMPT_TEMPLATE = "\n\nSummary of conversation earlier between Rose and the user: {summary}"
 
-def get_character_response_chain(summary: str = "") -> Runnable[dict[str, Any], str]:
+
+def format_summary_context(summary: str = "") -> str:
+    """Format the conversation summary for the character chain's turn context.
+
+    Args:
+        summary: Conversation summary, or an empty string if there is none yet
+
+    Returns:
+        str: Text appended to the turn context, empty when there is no summary
+    """
+    return SUMMARY_PROMPT_TEMPLATE.format(summary=summary) if summary else ""
+
+
+@lru_cache(maxsize=1)
+def get_character_response_chain() -> Runnable[dict[str, Any], str]:
     """Create a chain for generating Rose's character responses.
 
     This chain uses Rose's character card and conversation context to
     generate empathetic, therapeutic responses.
 
-    Args:
-        summary: Optional conversation summary for context continuity
+    The summary is an input variable ("summary_context", see
+    format_summary_context) rather than part of the template, so a single
+    chain is built and shared, and braces in a summary are never parsed as
+    template variables.
+
+    The character card is a system message of its own with no variables;
+    memories, the current activity and the summary follow it in a second
+    system message (TURN_CONTEXT_PROMPT). Every turn therefore starts with
+    the same prompt prefix, which the provider can cache.
 
     Returns:
         Runnable: Chain that takes messages and context, returns response text
     """
     model = get_chat_model()
-    system_message = CHARACTER_CARD_PROMPT
-
-    if summary:
-        system_message += f"\n\nSummary of conversation earlier between Rose and the user: {summary}"
 
     prompt = ChatPromptTemplate.from_messages(
         [
-            ("system", system_message),
+            ("system", CHARACTER_CARD_PROMPT),
+            ("system", TURN_CONTEXT_PROMPT),
             MessagesPlaceholder(variable_name="messages"),
         ]
     )
@@ -9,22 +9,33 @@ speech modules, and text parsers.
 import asyncio
 import logging
 import re
-from functools import wraps
-from typing import Optional
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional, Union
 
 # Third-party
+from langchain_core.messages import BaseMessage
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.outputs import ChatGeneration
 from langchain_groq import ChatGroq
 
 # Local
 from ai_companion.core.exceptions import CircuitBreakerError, WorkflowError
-from ai_companion.modules.speech import TextToSpeech
 from ai_companion.settings import settings
 
+if TYPE_CHECKING:
+    from ai_companion.modules.speech import TextToSpeech
 
+# Stage directions and inner thoughts the LLM wraps in asterisks
+_ASTERISK_CONTENT = re.compile(r"\*.*?\*")
+
+
+@lru_cache(maxsize=4)
 def get_chat_model(temperature: Optional[float] = None) -> ChatGroq:
     """Get ChatGroq model with retry and timeout configuration.
 
+    Models are cached per temperature; the client is stateless between calls
+    and reusing it keeps its HTTP connection pool warm across nodes and turns.
+
     Args:
         temperature: Model temperature for response generation (0.0-1.0).
                     Defaults to settings.LLM_TEMPERATURE_DEFAULT if not provided.
@@ -42,12 +53,19 @@ def get_chat_model(temperature: Optional[float] = None) -> ChatGroq:
     )
 
 
-def get_text_to_speech_module() -> TextToSpeech:
-    """Get TextToSpeech module instance.
+@lru_cache(maxsize=1)
+def get_text_to_speech_module() -> "TextToSpeech":
+    """Get the shared TextToSpeech module instance.
+
+    A single instance is reused so its audio cache and ElevenLabs client
+    persist across turns instead of starting empty on every audio_node call.
+    The speech SDKs are imported here, on first use, rather than with the graph.
 
     Returns:
         TextToSpeech: Configured TTS module for audio generation
     """
+    from ai_companion.modules.speech import TextToSpeech
+
     return TextToSpeech()
 
 
@@ -60,7 +78,10 @@ def remove_asterisk_content(text: str) -> str:
     Returns:
         str: Text with asterisk content removed and whitespace stripped
     """
-    return re.sub(r"\*.*?\*", "", text).strip()
+    # Most replies have no stage directions; skip the regex for them
+    if "*" not in text:
+        return text.strip()
+    return _ASTERISK_CONTENT.sub("", text).strip()
 
 
 class AsteriskRemovalParser(StrOutputParser):
@@ -68,6 +89,10 @@ class AsteriskRemovalParser(StrOutputParser):
 
     This parser extends StrOutputParser to automatically clean up
     asterisk-wrapped stage directions or internal thoughts from responses.
+
+    Streamed chunks are passed through unmodified: stripping each token would
+    drop the spaces between words and miss asterisk pairs split across chunks,
+    so streaming callers clean complete segments with remove_asterisk_content.
     """
 
     def parse(self, text: str) -> str:
@@ -81,6 +106,14 @@ class AsteriskRemovalParser(StrOutputParser):
         """
         return remove_asterisk_content(super().parse(text))
 
+    def _transform(self, input: Iterator[Union[str, BaseMessage]]) -> Iterator[str]:
+        for chunk in input:
+            yield ChatGeneration(message=chunk).text if isinstance(chunk, BaseMessage) else chunk
+
+    async def _atransform(self, input: AsyncIterator[Union[str, BaseMessage]]) -> AsyncIterator[str]:
+        async for chunk in input:
+            yield ChatGeneration(message=chunk).text if isinstance(chunk, BaseMessage) else chunk
+
 
 def node_error_wrapper(func):
     """Decorator for LangGraph nodes to add structured exception logging.
@@ -4,7 +4,6 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
@@ -45,6 +44,7 @@ from ai_companion.config.server_config import (
     WEB_SERVER_PORT,
 )
 from ai_companion.core.backup import backup_manager
+from ai_companion.core.checkpointer import open_sqlite_checkpointer
 from ai_companion.core.error_responses import (
     ai_companion_error_handler,
     global_exception_handler,
@@ -55,12 +55,12 @@ from ai_companion.core.logging_config import configure_logging, get_logger
 from ai_companion.core.monitoring_scheduler import scheduler as monitoring_scheduler
 from ai_companion.core.session_cleanup import cleanup_old_sessions
 from ai_companion.graph.graph import create_workflow_graph
+from ai_companion.graph.utils.helpers import get_text_to_speech_module
 from ai_companion.interfaces.web.middleware import RequestIDMiddleware, SecurityHeadersMiddleware
 from ai_companion.interfaces.web.routes import admin, health, monitoring, session, voice, voice_websocket
 from ai_companion.interfaces.web.routes import metrics as metrics_route
 from ai_companion.settings import settings
 from ai_companion.modules.memory.long_term.vector_store import get_vector_store
-from ai_companion.modules.speech.text_to_speech import TextToSpeech
 
 # Configure structured logging before any other imports
 configure_logging()
@@ -139,10 +139,11 @@ async def lifespan(app: FastAPI):
     )
 
     # Phase 1 Optimization: Warm TTS cache on startup
-    # Pre-generate common therapeutic phrases to improve first-response latency
+    # Pre-generate common therapeutic phrases to improve first-response latency.
+    # Warms the instance the graph synthesizes with, so the cached phrases are actually served.
     if settings.FEATURE_TTS_CACHE_ENABLED:
         try:
-            tts = TextToSpeech(enable_cache=True)
+            tts = get_text_to_speech_module()
             await tts.warm_cache()
             logger.info("tts_cache_warmed", emoji=LOG_EMOJI_SUCCESS, phrases_cached=len(tts._cache))
         except Exception as e:
@@ -152,7 +153,7 @@ async def lifespan(app: FastAPI):
     # This eliminates per-request SQLite connection creation and graph recompilation.
     db_path = Path(settings.SHORT_TERM_MEMORY_DB_PATH)
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    async with AsyncSqliteSaver.from_conn_string(str(db_path)) as checkpointer:
+    async with open_sqlite_checkpointer(db_path) as checkpointer:
         compiled_graph = create_workflow_graph().compile(checkpointer=checkpointer)
         app.state.checkpointer = checkpointer
         app.state.compiled_graph = compiled_graph
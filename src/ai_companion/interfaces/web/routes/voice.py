@@ -441,6 +441,20 @@ async def _generate_audio_response(response_text: str, session_id: str, tts: Tex
         raise TextToSpeechError(ERROR_MSG_TTS_FAILED.format(response_text=response_text))
 
 
+def _write_new_file(path: Path, data: bytes) -> None:
+    """Create a file readable only by its owner and write data to it.
+
+    Raises:
+        FileExistsError: If the file already exists
+    """
+    # Create file with secure permissions (owner read/write only)
+    fd = os.open(str(path), os.O_CREAT | os.O_WRONLY | os.O_EXCL, stat.S_IRUSR | stat.S_IWUSR)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
 async def _save_audio_file(audio_bytes: bytes, session_id: str, audio_dir: Path) -> str:
     """Save audio file with secure permissions and retry logic.
 
@@ -460,12 +474,8 @@ async def _save_audio_file(audio_bytes: bytes, session_id: str, audio_dir: Path)
         audio_path = audio_dir / f"{audio_id}.mp3"
 
         try:
-            # Create file with secure permissions (owner read/write only)
-            fd = os.open(str(audio_path), os.O_CREAT | os.O_WRONLY | os.O_EXCL, stat.S_IRUSR | stat.S_IWUSR)
-            try:
-                os.write(fd, audio_bytes)
-            finally:
-                os.close(fd)
+            # One thread hop for open, write and close, keeping disk I/O off the event loop
+            await asyncio.to_thread(_write_new_file, audio_path, audio_bytes)
 
             logger.info("audio_file_saved", audio_id=audio_id, path=str(audio_path), session_id=session_id)
             return f"{AUDIO_SERVE_PATH}/{audio_id}"
@@ -21,7 +21,8 @@ Message Types (JSON):
 - {"type": "stop_listening"}: End audio capture, process
 - {"type": "interrupt"}: Stop current response
 - {"type": "transcription", "text": "..."}: Partial/final transcription
-- {"type": "response", "text": "..."}: Rose's response text
+- {"type": "response", "text": "..."}: Rose's response text (sent once the reply is
+  complete, so streamed audio may start before it)
 - {"type": "audio_start"}: Audio streaming starting
 - {"type": "audio_end"}: Audio streaming complete
 - {"type": "error", "message": "..."}: Error occurred
@@ -34,17 +35,18 @@ Binary Messages:
 import asyncio
 import json
 import logging
+from contextlib import AsyncExitStack
+from pathlib import Path
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
 from langchain_core.messages import HumanMessage
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
+from ai_companion.core.checkpointer import open_sqlite_checkpointer
 from ai_companion.core.logging_config import get_logger
 from ai_companion.core.metrics import metrics
 from ai_companion.graph.graph import create_workflow_graph
-from ai_companion.modules.speech.speech_to_text import SpeechToText
-from ai_companion.modules.speech.text_to_speech import TextToSpeech
+from ai_companion.interfaces.web.routes.voice import get_stt
 from ai_companion.settings import settings
 
 logger = get_logger(__name__)
@@ -76,8 +78,28 @@ class VoiceWebSocketSession:
         self.is_listening = False
         self.is_responding = False
         self.interrupted = False
-        self.stt = SpeechToText()
-        self.tts = TextToSpeech()
+        self._graph: Any = None
+        self._exit_stack = AsyncExitStack()
+    
+    async def get_graph(self) -> Any:
+        """Return the workflow graph for this connection.
+
+        Uses the graph and checkpointer compiled once in the app lifespan (see app.py).
+        Outside it (e.g. a bare router), a checkpointer is opened on the first turn and
+        kept for the rest of the connection, so later turns skip the connect and compile.
+        """
+        if self._graph is None:
+            self._graph = getattr(self.websocket.app.state, "compiled_graph", None)
+        if self._graph is None:
+            db_path = Path(settings.SHORT_TERM_MEMORY_DB_PATH)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            checkpointer = await self._exit_stack.enter_async_context(open_sqlite_checkpointer(db_path))
+            self._graph = create_workflow_graph().compile(checkpointer=checkpointer)
+        return self._graph
+
+    async def close(self) -> None:
+        """Release the connection's checkpointer, if one was opened."""
+        await self._exit_stack.aclose()
     
     async def send_json(self, msg_type: str, **kwargs) -> None:
         """Send a JSON control message to the client."""
@@ -103,11 +125,10 @@ class VoiceWebSocketSession:
 
 async def get_ws_checkpointer():
     """Create checkpointer for WebSocket sessions."""
-    from pathlib import Path
     db_path = Path(settings.SHORT_TERM_MEMORY_DB_PATH)
     db_path.parent.mkdir(parents=True, exist_ok=True)
     
-    async with AsyncSqliteSaver.from_conn_string(str(db_path)) as checkpointer:
+    async with open_sqlite_checkpointer(db_path) as checkpointer:
         yield checkpointer
 
 
@@ -185,6 +206,69 @@ async def voice_websocket(
         except Exception:
             pass
 
+    finally:
+        await session.close()
+
+
+async def _run_workflow(
+    session: VoiceWebSocketSession,
+    graph: Any,
+    workflow_input: dict[str, Any],
+    config: dict[str, Any],
+    deadline: Optional[asyncio.Timeout] = None,
+) -> Optional[str]:
+    """Run the workflow, sending Rose's reply to the client as soon as audio_node produces it.
+
+    Each sentence's audio is forwarded as audio_node emits it. The reply text, and the
+    whole audio if none was streamed, is sent when audio_node finishes, so the client
+    does not wait for a conversation summary that may run after it. The run always
+    completes, even after an interrupt, so the turn is still checkpointed; an interrupt
+    only stops output to the client. Once the reply has been sent, deadline is cleared and
+    the rest of the run (summary, memory extraction) gets a fresh WORKFLOW_TIMEOUT_SECONDS:
+    the client already has its answer, so running past that only ends the run, without an error.
+
+    Returns:
+        Rose's reply text, or None if the client interrupted before it was sent
+    """
+    response_text: Optional[str] = None
+    audio_streamed = False
+    streamed_bytes = 0
+    # Only given a deadline once the reply is sent, so its timeout never fires before that
+    post_reply = asyncio.timeout(None)
+    try:
+        async with post_reply:
+            async for mode, chunk in graph.astream(workflow_input, config=config, stream_mode=["custom", "updates"]):
+                if session.interrupted:
+                    continue
+                if mode == "custom":
+                    if "audio_chunk" in chunk:
+                        if not audio_streamed:
+                            await session.send_json(MSG_AUDIO_START)
+                            audio_streamed = True
+                        await session.send_audio(chunk["audio_chunk"])
+                        streamed_bytes += len(chunk["audio_chunk"])
+                elif "audio_node" in chunk:
+                    reply = chunk["audio_node"]
+                    response_text = reply["messages"].content
+                    await session.send_json(MSG_RESPONSE, text=response_text)
+
+                    # The reply's audio_buffer starts with whatever was streamed: nothing if sentence
+                    # streaming is off or the first segment failed, some sentences if a later one
+                    # failed. Send only the part the client has not received; it is already
+                    # synthesized (or TTS is down), so it is not synthesized again here.
+                    if not audio_streamed:
+                        await session.send_json(MSG_AUDIO_START)
+                    remaining_audio = (reply.get("audio_buffer") or b"")[streamed_bytes:]
+                    if remaining_audio:
+                        await session.send_audio(remaining_audio)
+                    await session.send_json(MSG_AUDIO_END, interrupted=False)
+                    if deadline is not None:
+                        deadline.reschedule(None)
+                    post_reply.reschedule(asyncio.get_running_loop().time() + settings.WORKFLOW_TIMEOUT_SECONDS)
+    except TimeoutError:
+        logger.warning("ws_post_reply_timeout", session_id=session.session_id)
+    return response_text
+
 
 async def _process_audio_and_respond(session: VoiceWebSocketSession) -> None:
     """Process buffered audio and stream response back to client.
@@ -192,9 +276,9 @@ async def _process_audio_and_respond(session: VoiceWebSocketSession) -> None:
     This is the core processing pipeline for WebSocket voice:
     1. Transcribe audio (STT)
     2. Send transcription to client
-    3. Run LangGraph workflow
-    4. Send response text to client
-    5. Stream TTS audio to client
+    3. Run LangGraph workflow, streaming each sentence's TTS audio as it is ready
+    4. Send response text to client once the reply is complete
+    5. Send the full audio instead, if nothing was streamed
     
     Supports interruption at any point.
     """
@@ -208,7 +292,7 @@ async def _process_audio_and_respond(session: VoiceWebSocketSession) -> None:
             logger.debug("ws_audio_too_short", session_id=session_id, size=len(audio_data))
             return
         
-        transcription = await session.stt.transcribe(audio_data)
+        transcription = await get_stt().transcribe(audio_data)
         
         if not transcription or not transcription.strip():
             logger.debug("ws_empty_transcription", session_id=session_id)
@@ -223,54 +307,18 @@ async def _process_audio_and_respond(session: VoiceWebSocketSession) -> None:
         # Step 2: Process through workflow
         session.is_responding = True
         
-        # Create checkpointer inline (WebSocket doesn't use FastAPI Depends)
-        from pathlib import Path
-        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
-        
-        db_path = Path(settings.SHORT_TERM_MEMORY_DB_PATH)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        async with AsyncSqliteSaver.from_conn_string(str(db_path)) as checkpointer:
-            graph = create_workflow_graph().compile(checkpointer=checkpointer)
-            config = {"configurable": {"thread_id": session_id}}
-            
-            result = await asyncio.wait_for(
-                graph.ainvoke(
-                    {"messages": [HumanMessage(content=transcription)]},
-                    config=config,
-                ),
-                timeout=settings.WORKFLOW_TIMEOUT_SECONDS,
-            )
-        
-        if session.interrupted:
+        config = {"configurable": {"thread_id": session_id}}
+        workflow_input = {"messages": [HumanMessage(content=transcription)]}
+
+        graph = await session.get_graph()
+        # The timeout covers the run until the reply is sent; _run_workflow gives the rest its own budget
+        async with asyncio.timeout(settings.WORKFLOW_TIMEOUT_SECONDS) as deadline:
+            response_text = await _run_workflow(session, graph, workflow_input, config, deadline)
+
+        if response_text is None:
             logger.info("ws_interrupted_after_workflow", session_id=session_id)
             return
-        
-        response_text = result["messages"][-1].content
-        
-        # Send response text to client
-        await session.send_json(MSG_RESPONSE, text=response_text)
-        
-        # Step 3: Stream TTS audio
-        await session.send_json(MSG_AUDIO_START)
-        
-        try:
-            async for audio_chunk in session.tts.synthesize_streaming(response_text):
-                if session.interrupted:
-                    logger.info("ws_interrupted_during_tts", session_id=session_id)
-                    break
-                await session.send_audio(audio_chunk)
-        except Exception as tts_error:
-            logger.warning("ws_tts_streaming_failed", session_id=session_id, error=str(tts_error))
-            # Fall back to batch TTS
-            try:
-                audio_bytes = await session.tts.synthesize(response_text)
-                if not session.interrupted:
-                    await session.send_audio(audio_bytes)
-            except Exception as batch_error:
-                logger.error("ws_tts_batch_failed", session_id=session_id, error=str(batch_error))
-        
-        await session.send_json(MSG_AUDIO_END, interrupted=session.interrupted)
+
         session.is_responding = False
         
         logger.info("ws_response_complete", session_id=session_id, response_length=len(response_text))
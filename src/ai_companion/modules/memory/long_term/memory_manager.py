@@ -47,11 +47,14 @@ Example:
 
 import hashlib
 import logging
+import threading
 import uuid
+from collections import deque
 from datetime import datetime, timedelta
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 from langchain_core.messages import BaseMessage
 from langchain_groq import ChatGroq
 from pydantic import BaseModel, Field
@@ -63,6 +66,8 @@ from ai_companion.settings import settings
 # Phase 3: Memory search cache configuration
 MEMORY_CACHE_TTL_SECONDS = 60  # Cache search results for 1 minute
 MEMORY_CACHE_MAX_SIZE = 100  # Maximum number of cached search results
+MEMORY_SEMANTIC_CACHE_THRESHOLD = 0.9  # Cosine similarity at which a cached search is reused
+MEMORY_SEMANTIC_CACHE_MAX_SIZE = 128  # Maximum number of cached query embeddings
 
 
 class MemoryAnalysis(BaseModel):
@@ -122,6 +127,14 @@ class MemoryManager:
         # Phase 3: Search result caching for reduced Qdrant query latency
         # Cache key: hash of (context, session_id), value: (memories, timestamp)
         self._search_cache: Dict[str, Tuple[List[str], datetime]] = {}
+        # Semantic cache: consecutive turns share most of their context, so a near-identical
+        # query embedding reuses the earlier search instead of another Qdrant round-trip.
+        # Entries: (session_id, unit-length query embedding, memories, timestamp)
+        self._semantic_cache: Deque[Tuple[Optional[str], Any, List[str], datetime]] = deque(
+            maxlen=MEMORY_SEMANTIC_CACHE_MAX_SIZE
+        )
+        # Retrievals run in worker threads, so reads and writes of the deque are serialized
+        self._semantic_cache_lock = threading.Lock()
 
     async def _analyze_memory(self, message: str) -> MemoryAnalysis:
         """Analyze a message to determine importance and format if needed.
@@ -253,6 +266,50 @@ class MemoryManager:
         self._search_cache[cache_key] = (memories, datetime.now())
         self.logger.debug(f"📦 Memory cached: {cache_key[:16]}... ({len(memories)} memories)")
     
+    def _embed_context(self, context: str) -> Optional[Any]:
+        """Embed a search context as a unit vector, or return None if embedding fails.
+
+        Args:
+            context: Search context
+
+        Returns:
+            Optional[np.ndarray]: Normalized query embedding
+        """
+        try:
+            embedding = np.asarray(self.vector_store.model.encode(context), dtype=np.float32)
+        except Exception as e:
+            self.logger.debug(f"📦 Semantic cache skipped, context embedding failed: {e}")
+            return None
+        if embedding.ndim != 1:
+            return None
+        norm = float(np.linalg.norm(embedding))
+        return embedding / norm if norm else None
+
+    def _get_from_semantic_cache(self, embedding: Any, session_id: Optional[str]) -> Optional[List[str]]:
+        """Return memories cached for the most similar earlier query in this session, if close enough.
+
+        Args:
+            embedding: Normalized query embedding
+            session_id: Session identifier
+
+        Returns:
+            Optional[List[str]]: Cached memories or None if no fresh entry is similar enough
+        """
+        cutoff = datetime.now() - timedelta(seconds=MEMORY_CACHE_TTL_SECONDS)
+        best_similarity = MEMORY_SEMANTIC_CACHE_THRESHOLD
+        best_memories: Optional[List[str]] = None
+        with self._semantic_cache_lock:
+            entries = tuple(self._semantic_cache)
+        for cached_session, cached_embedding, memories, timestamp in entries:
+            if cached_session != session_id or timestamp < cutoff:
+                continue
+            similarity = float(np.dot(embedding, cached_embedding))
+            if similarity >= best_similarity:
+                best_similarity, best_memories = similarity, memories
+        if best_memories is not None:
+            self.logger.debug(f"📦 Memory semantic cache hit (similarity: {best_similarity:.3f})")
+        return best_memories
+
     def invalidate_cache(self, session_id: Optional[str] = None) -> None:
         """Invalidate cache entries, optionally filtered by session.
         
@@ -261,6 +318,13 @@ class MemoryManager:
         Args:
             session_id: If provided, only invalidate entries for this session
         """
+        with self._semantic_cache_lock:
+            if session_id is None:
+                self._semantic_cache.clear()
+            else:
+                kept = [entry for entry in self._semantic_cache if entry[0] != session_id]
+                self._semantic_cache.clear()
+                self._semantic_cache.extend(kept)
         if session_id is None:
             count = len(self._search_cache)
             self._search_cache.clear()
@@ -276,7 +340,9 @@ class MemoryManager:
         """Retrieve relevant memories based on the current context.
 
         Phase 3 Optimization: Results are cached for MEMORY_CACHE_TTL_SECONDS to
-        reduce repeated Qdrant queries during a conversation turn.
+        reduce repeated Qdrant queries during a conversation turn. Contexts whose
+        embedding is within MEMORY_SEMANTIC_CACHE_THRESHOLD cosine similarity of a
+        cached query in the same session reuse that query's results.
 
         Performs semantic search in the vector store to find memories that are
         relevant to the given context. Returns the top-K most similar memories
@@ -304,8 +370,17 @@ class MemoryManager:
         if cached_result is not None:
             return cached_result
         
-        # Cache miss - query vector store
-        memories = self.vector_store.search_memories(context, k=settings.MEMORY_TOP_K, session_id=session_id)
+        # Exact miss - a semantically similar recent query may still answer it
+        query_embedding = self._embed_context(context)
+        if query_embedding is not None:
+            similar_result = self._get_from_semantic_cache(query_embedding, session_id)
+            if similar_result is not None:
+                return similar_result
+
+        # Cache miss - query vector store, reusing the embedding computed above
+        memories = self.vector_store.search_memories(
+            context, k=settings.MEMORY_TOP_K, session_id=session_id, query_embedding=query_embedding
+        )
 
         # Phase 5: Sort by temporal score (recent memories weighted higher)
         # This ensures fresh memories are prioritized over stale ones
@@ -322,6 +397,9 @@ class MemoryManager:
         
         # Add to cache
         self._add_to_cache(cache_key, memory_texts)
+        if query_embedding is not None:
+            with self._semantic_cache_lock:
+                self._semantic_cache.append((session_id, query_embedding, memory_texts, datetime.now()))
         
         return memory_texts
 
@@ -14,7 +14,7 @@ Module Dependencies:
 - ai_companion.settings: Configuration for Qdrant URL, API key, collection settings
 - qdrant_client: QdrantClient for vector database operations
 - sentence_transformers: SentenceTransformer for embedding generation
-- Standard library: os, dataclasses, datetime, functools, typing
+- Standard library: os, dataclasses, datetime, functools, threading, typing
 
 Dependents (modules that import this):
 - ai_companion.modules.memory.long_term.memory_manager: Memory persistence operations
@@ -47,6 +47,7 @@ Example:
 """
 
 import logging
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
@@ -156,6 +157,77 @@ class Memory:
             return "low"
 
 
+@dataclass
+class _EmbeddingRequest:
+    """A text waiting to be embedded, and its result once a batch has run."""
+
+    text: str
+    embedding: Any = None
+    error: Optional[BaseException] = None
+    done: bool = False
+
+
+class EmbeddingBatcher:
+    """Coalesce concurrent encode() calls into batched calls on the embedding model.
+
+    Embeddings are computed from worker threads (sync graph nodes run through
+    asyncio.to_thread), so with several sessions active, requests often
+    arrive while the model is busy. Callers that arrive during a model call
+    queue up, and when it finishes one of them encodes the whole queue in a
+    single batch. A request that finds the model idle is encoded on its own
+    straight away, so batching never adds waiting time.
+    """
+
+    def __init__(self, model: SentenceTransformer) -> None:
+        self._model = model
+        self._pending: List[_EmbeddingRequest] = []
+        self._pending_lock = threading.Lock()
+        self._model_lock = threading.Lock()
+
+    def encode(self, text: Any, **kwargs: Any) -> Any:
+        """Embed a single text, batched with any concurrent requests.
+
+        Lists of texts and calls with encode options go straight to the model.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector, as returned by SentenceTransformer.encode
+        """
+        if kwargs or not isinstance(text, str):
+            return self._model.encode(text, **kwargs)
+
+        request = _EmbeddingRequest(text)
+        with self._pending_lock:
+            self._pending.append(request)
+        with self._model_lock:
+            # Whoever held the model may already have encoded this request in its batch
+            if not request.done:
+                with self._pending_lock:
+                    batch, self._pending = self._pending, []
+                self._encode_batch(batch)
+
+        if request.error is not None:
+            raise request.error
+        return request.embedding
+
+    def _encode_batch(self, batch: List[_EmbeddingRequest]) -> None:
+        """Encode a batch of requests and hand each its own result (or the error)."""
+        try:
+            if len(batch) == 1:
+                batch[0].embedding = self._model.encode(batch[0].text)
+            else:
+                embeddings = self._model.encode([request.text for request in batch])
+                for request, embedding in zip(batch, embeddings):
+                    request.embedding = embedding
+        except Exception as e:
+            for request in batch:
+                request.error = e
+        for request in batch:
+            request.done = True
+
+
 class VectorStore:
     """A class to handle vector storage operations using Qdrant.
 
@@ -193,7 +265,7 @@ class VectorStore:
         """
         if not self._initialized:
             self.logger = logging.getLogger(__name__)
-            self.model: SentenceTransformer = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            self.model: EmbeddingBatcher = EmbeddingBatcher(SentenceTransformer(EMBEDDING_MODEL_NAME))
 
             # 🔧 Initialize Qdrant client with optional API key support
             # API key is only required for Qdrant Cloud, not for local Docker deployments
@@ -390,7 +462,11 @@ class VectorStore:
                 self.logger.error(f"⚡ Circuit breaker OPEN: Cannot store memory. Text: {text[:50]}...")
 
     def search_memories(
-        self, query: str, k: int = DEFAULT_MEMORY_SEARCH_LIMIT, session_id: Optional[str] = None
+        self,
+        query: str,
+        k: int = DEFAULT_MEMORY_SEARCH_LIMIT,
+        session_id: Optional[str] = None,
+        query_embedding: Optional[Any] = None,
     ) -> MemorySearchResult:
         """Search for similar memories in the vector store using semantic search.
 
@@ -405,6 +481,7 @@ class VectorStore:
             query: Text to search for (will be embedded for similarity comparison)
             k: Number of results to return (default: DEFAULT_MEMORY_SEARCH_LIMIT = 5)
             session_id: Optional session ID to filter by (required if ENABLE_SESSION_ISOLATION=True)
+            query_embedding: Optional precomputed embedding of query (skips encoding it again)
 
         Returns:
             List[Memory]: Memory objects ordered by relevance (highest score first)
@@ -437,7 +514,8 @@ class VectorStore:
             self.logger.debug(f"🔍 Searching memories: query='{query[:60]}...', k={k}, session={effective_session_id}")
 
             # 🧠 Generate embedding for the query using the same model as storage
-            query_embedding: Any = self.model.encode(query)
+            if query_embedding is None:
+                query_embedding = self.model.encode(query)
             # Log query embedding dimension for observability
             try:
                 self.logger.debug(f"🧩 Query embedding dimension: {len(query_embedding)}")
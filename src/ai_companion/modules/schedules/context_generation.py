@@ -1,10 +1,14 @@
-from datetime import datetime, time
+import time
+from datetime import datetime
 from typing import Dict, Optional
 
 from ai_companion.core.schedules import (
+    DAY_ACTIVITIES,
     FRIDAY_SCHEDULE,
     MONDAY_SCHEDULE,
+    NO_SLOT,
     SATURDAY_SCHEDULE,
+    SLOT_BY_MINUTE,
     SUNDAY_SCHEDULE,
     THURSDAY_SCHEDULE,
     TUESDAY_SCHEDULE,
@@ -25,13 +29,8 @@ class ScheduleContextGenerator:
         6: SUNDAY_SCHEDULE,  # Sunday
     }
 
-    @staticmethod
-    def _parse_time_range(time_range: str) -> tuple[time, time]:
-        """Parse a time range string (e.g., '06:00-07:00') into start and end times."""
-        start_str, end_str = time_range.split("-")
-        start_time = datetime.strptime(start_str, "%H:%M").time()
-        end_time = datetime.strptime(end_str, "%H:%M").time()
-        return start_time, end_time
+    # (epoch minute, activity) from the last lookup; slots are 30+ minutes, so a minute is exact enough
+    _activity_cache: Optional[tuple[int, Optional[str]]] = None
 
     @classmethod
     def get_current_activity(cls) -> Optional[str]:
@@ -40,27 +39,23 @@ class ScheduleContextGenerator:
         Returns:
             str: Description of current activity, or None if no matching time slot is found
         """
-        # Get current time and day of week (0 = Monday, 6 = Sunday)
-        current_datetime = datetime.now()
-        current_time = current_datetime.time()
-        current_day = current_datetime.weekday()
-
-        # Get schedule for current day
-        schedule = cls.SCHEDULES.get(current_day, {})
+        # Several nodes ask within the same turn; reuse the answer for the rest of the minute
+        now_minute = int(time.time() // 60)
+        cached = cls._activity_cache
+        if cached is not None and cached[0] == now_minute:
+            return cached[1]
 
-        # Find matching time slot
-        for time_range, activity in schedule.items():
-            start_time, end_time = cls._parse_time_range(time_range)
+        activity = cls._activity_at(datetime.now())
+        cls._activity_cache = (now_minute, activity)
+        return activity
 
-            # Handle overnight activities (e.g., 23:00-06:00)
-            if start_time > end_time:
-                if current_time >= start_time or current_time <= end_time:
-                    return activity
-            else:
-                if start_time <= current_time <= end_time:
-                    return activity
-
-        return None
+    @staticmethod
+    def _activity_at(moment: datetime) -> Optional[str]:
+        """Look up the scheduled activity for a given moment."""
+        slot = SLOT_BY_MINUTE[moment.hour * 60 + moment.minute]
+        if slot == NO_SLOT:
+            return None
+        return DAY_ACTIVITIES[moment.weekday()][slot]
 
     @classmethod
     def get_schedule_for_day(cls, day: int) -> Dict[str, str]:
@@ -49,6 +49,9 @@ from ai_companion.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Every reply sentence goes through the cache, so it is bounded; least recently used entries go first
+TTS_CACHE_MAX_ENTRIES = 256
+
 
 class TextToSpeech:
     """A class to handle text-to-speech conversion using ElevenLabs with Rose's therapeutic voice.
@@ -311,6 +314,7 @@ class TextToSpeech:
 
         This method handles TTS failures gracefully and provides a text-only fallback
         when audio generation is unavailable, ensuring Rose can always respond to users.
+        Audio is served from the cache when the same text was synthesized recently.
 
         Args:
             text: Text to convert to speech
@@ -327,7 +331,7 @@ class TextToSpeech:
             This method never raises exceptions - it always returns a usable response.
         """
         try:
-            audio_bytes = await self.synthesize(
+            audio_bytes = await self.synthesize_cached(
                 text=text, voice_id=voice_id, stability=stability, similarity_boost=similarity_boost
             )
             self._tts_available = True  # Reset availability flag on success
@@ -399,6 +403,8 @@ class TextToSpeech:
             audio_bytes, timestamp = self._cache[cache_key]
             if datetime.now() - timestamp < self._cache_ttl:
                 logger.info(f"Cache hit for key: {cache_key[:16]}...")
+                # Move to the end of the insertion order, so eviction skips recently used audio
+                self._cache[cache_key] = self._cache.pop(cache_key)
                 return audio_bytes
             else:
                 # Expired - remove from cache
@@ -415,6 +421,10 @@ class TextToSpeech:
             audio_bytes: Audio data to cache
         """
         if self._cache_enabled:
+            if cache_key not in self._cache and len(self._cache) >= TTS_CACHE_MAX_ENTRIES:
+                evicted_key = next(iter(self._cache))
+                del self._cache[evicted_key]
+                logger.debug(f"Cache evicted key: {evicted_key[:16]}...")
             self._cache[cache_key] = (audio_bytes, datetime.now())
             logger.debug(f"Cached audio for key: {cache_key[:16]}... ({len(audio_bytes)} bytes)")
 
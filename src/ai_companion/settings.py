@@ -90,6 +90,7 @@ class Settings(BaseSettings):
 
     # Memory configuration
     MEMORY_TOP_K: int = 5
+    MEMORY_RETRIEVAL_TIMEOUT_SECONDS: float = 3.0  # Budget for memory lookup before replying without it
     TOTAL_MESSAGES_SUMMARY_TRIGGER: int = 30
     TOTAL_MESSAGES_AFTER_SUMMARY: int = 10
 
@@ -120,10 +121,15 @@ class Settings(BaseSettings):
 
     # Session cleanup configuration
     SESSION_RETENTION_DAYS: int = 7  # Delete sessions older than 7 days
+    SESSION_CLEANUP_VACUUM_THRESHOLD: int = 1000  # Reclaim free pages after deleting at least this many checkpoints
+    SESSION_CLEANUP_FULL_VACUUM: bool = False  # Allow a one-off VACUUM to switch the DB to incremental auto_vacuum
 
     # Feature Flags
     FEATURE_TTS_CACHE_ENABLED: bool = True  # Enable TTS response caching
     FEATURE_TIMING_METRICS_ENABLED: bool = True  # Include pipeline timing metrics in response
+    FEATURE_CIRCUIT_BREAKER_ENABLED: bool = True  # Disable to bypass circuit breakers (local dev/tests)
+    FEATURE_TTS_SENTENCE_STREAMING_ENABLED: bool = True  # Synthesize sentences while the LLM is still streaming
+    FEATURE_LONG_TERM_MEMORY_ENABLED: bool = True  # Disable to skip Qdrant memory extraction and retrieval
 
     # Speech-to-text configuration
     STT_MAX_RETRIES: int = 3  # Maximum retry attempts for STT
@@ -280,6 +286,7 @@ class Settings(BaseSettings):
         "STT_TIMEOUT",
         "CIRCUIT_BREAKER_RECOVERY_TIMEOUT",
         "LLM_TIMEOUT_SECONDS",
+        "MEMORY_RETRIEVAL_TIMEOUT_SECONDS",
     )
     @classmethod
     def validate_timeout_values(cls, v: float | int, info: Any) -> float | int:
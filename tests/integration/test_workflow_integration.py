@@ -17,6 +17,14 @@ from langchain_core.messages import AIMessage, HumanMessage
 from ai_companion.graph.graph import create_workflow_graph
 
 
+@pytest.fixture(autouse=True)
+def serial_audio_path(monkeypatch):
+    """Run audio_node's non-streaming path, which the ainvoke-only chain mocks here exercise."""
+    from ai_companion.settings import settings
+
+    monkeypatch.setattr(settings, "FEATURE_TTS_SENTENCE_STREAMING_ENABLED", False)
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 class TestConversationWorkflow:
@@ -1,11 +1,13 @@
 """Tests for circuit breaker resilience patterns."""
 
 import asyncio
+import inspect
+import threading
 import time
 
 import pytest
 
-from ai_companion.core.resilience import CircuitBreaker, CircuitBreakerError
+from ai_companion.core.resilience import CircuitBreaker, CircuitBreakerError, NullCircuitBreaker, circuit_breaker
 
 
 class TestCircuitBreaker:
@@ -145,6 +147,76 @@ class TestCircuitBreaker:
         # Circuit should still be CLOSED (RuntimeError not counted)
         assert breaker.state == "CLOSED"
 
+    def test_programming_errors_not_counted(self):
+        """Test skip_exceptions propagate without moving the breaker toward OPEN."""
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=1,
+            name="SkipExceptionBreaker",
+            skip_exceptions=(TypeError, AttributeError),
+        )
+
+        def buggy_call():
+            return None.text
+
+        with pytest.raises(AttributeError):
+            breaker.call(buggy_call)
+
+        assert breaker.state == "CLOSED"
+        assert breaker._failure_count == 0
+
+    def test_programming_errors_counted_by_default(self):
+        """Test a breaker without skip_exceptions counts every expected exception."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1, name="DefaultSkipBreaker")
+
+        def bad_response_call():
+            return None.text
+
+        with pytest.raises(AttributeError):
+            breaker.call(bad_response_call)
+
+        assert breaker.state == "OPEN"
+
+    @pytest.mark.asyncio
+    async def test_async_programming_errors_not_counted(self):
+        """Test async skip_exceptions behave like the sync path."""
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            recovery_timeout=1,
+            name="AsyncSkipExceptionBreaker",
+            skip_exceptions=(TypeError, AttributeError),
+        )
+
+        async def buggy_call():
+            raise TypeError("bad argument")
+
+        with pytest.raises(TypeError):
+            await breaker.call_async(buggy_call)
+
+        assert breaker.state == "CLOSED"
+
+    def test_circuit_breaker_exception_tuple(self):
+        """Test circuit breaker counts every type in an expected_exception tuple."""
+        breaker = CircuitBreaker(
+            failure_threshold=2,
+            recovery_timeout=1,
+            expected_exception=(ConnectionError, TimeoutError),
+            name="TupleExceptionBreaker",
+        )
+
+        def connection_error_call():
+            raise ConnectionError("reset")
+
+        def timeout_call():
+            raise TimeoutError("slow")
+
+        with pytest.raises(ConnectionError):
+            breaker.call(connection_error_call)
+        with pytest.raises(TimeoutError):
+            breaker.call(timeout_call)
+
+        assert breaker.state == "OPEN"
+
     def test_circuit_state_transitions(self):
         """Test complete circuit state transitions: CLOSED → OPEN → HALF_OPEN → CLOSED."""
         breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=1, name="StateTransitionBreaker")
@@ -282,3 +354,224 @@ class TestCircuitBreaker:
         with pytest.raises(Exception):
             await breaker.call_async(async_failing_call)
         assert breaker.state == "OPEN"
+
+    def test_concurrent_failures_counted_exactly(self):
+        """Test failures recorded from many threads are not lost."""
+        breaker = CircuitBreaker(failure_threshold=1000, recovery_timeout=1, name="ThreadedBreaker")
+
+        def failing_call():
+            raise Exception("Service error")
+
+        def worker():
+            for _ in range(50):
+                with pytest.raises(Exception):
+                    breaker.call(failing_call)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert breaker._failure_count == 400
+        assert breaker.state == "CLOSED"
+
+    def test_lock_not_held_during_call(self):
+        """Test the wrapped function runs without holding the breaker lock."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=1, name="LockScopeBreaker")
+        in_call = threading.Event()
+        release = threading.Event()
+
+        def slow_call():
+            in_call.set()
+            release.wait(timeout=2)
+            return "slow"
+
+        t = threading.Thread(target=breaker.call, args=(slow_call,))
+        t.start()
+        assert in_call.wait(timeout=2)
+
+        # A second caller must not be blocked by the in-flight call
+        assert breaker.call(lambda: "fast") == "fast"
+
+        release.set()
+        t.join()
+
+    @pytest.mark.asyncio
+    async def test_half_open_single_probe_on_failure(self):
+        """Test concurrent HALF_OPEN callers send one probe and fail fast if it fails."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1, name="SingleFlightBreaker")
+        calls = [0]
+
+        async def failing_call():
+            calls[0] += 1
+            await asyncio.sleep(0.05)
+            raise Exception("Still down")
+
+        with pytest.raises(Exception, match="Still down"):
+            await breaker.call_async(failing_call)
+        assert breaker.state == "OPEN"
+
+        await asyncio.sleep(1.1)
+        calls[0] = 0
+        results = await asyncio.gather(*(breaker.call_async(failing_call) for _ in range(5)), return_exceptions=True)
+
+        assert calls[0] == 1
+        assert sum(isinstance(r, CircuitBreakerError) for r in results) == 4
+        assert breaker.state == "OPEN"
+
+    @pytest.mark.asyncio
+    async def test_half_open_waiters_proceed_after_successful_probe(self):
+        """Test callers waiting on a successful probe run once the circuit closes."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1, name="SingleFlightRecoveryBreaker")
+        in_flight = [0]
+        max_in_flight = [0]
+        healthy = [False]
+
+        async def flaky_call():
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            await asyncio.sleep(0.05)
+            in_flight[0] -= 1
+            if not healthy[0]:
+                raise Exception("Down")
+            return "ok"
+
+        with pytest.raises(Exception):
+            await breaker.call_async(flaky_call)
+
+        await asyncio.sleep(1.1)
+        healthy[0] = True
+        max_in_flight[0] = 0
+        results = await asyncio.gather(*(breaker.call_async(flaky_call) for _ in range(5)))
+
+        assert results == ["ok"] * 5
+        assert breaker.state == "CLOSED"
+        # The probe ran alone; the waiters only started after it closed the circuit
+        assert max_in_flight[0] == 4
+
+
+class TestCircuitBreakerDecorator:
+    """Test the circuit_breaker decorator."""
+
+    def test_decorator_wraps_sync_function(self):
+        """Test decorated sync functions stay sync and open after failures."""
+
+        @circuit_breaker(failure_threshold=2, recovery_timeout=10, name="SyncDecorated")
+        def failing_call():
+            """Always fails."""
+            raise Exception("Service unavailable")
+
+        assert not asyncio.iscoroutinefunction(failing_call)
+        assert failing_call.__name__ == "failing_call"
+        assert failing_call.__doc__ == "Always fails."
+        assert inspect.unwrap(failing_call) is not failing_call
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="Service unavailable"):
+                failing_call()
+
+        with pytest.raises(CircuitBreakerError):
+            failing_call()
+
+    @pytest.mark.asyncio
+    async def test_decorator_wraps_async_function(self):
+        """Test decorated coroutine functions stay awaitable."""
+
+        @circuit_breaker(failure_threshold=2, recovery_timeout=10, name="AsyncDecorated")
+        async def successful_call(value):
+            return value
+
+        assert asyncio.iscoroutinefunction(successful_call)
+        assert await successful_call("ok") == "ok"
+
+    def test_non_positive_threshold_rejected(self):
+        """Test a failure_threshold below 1 is a configuration error, not a disabled breaker."""
+        with pytest.raises(ValueError, match="failure_threshold must be at least 1"):
+            circuit_breaker(failure_threshold=0)
+
+        with pytest.raises(ValueError, match="failure_threshold must be at least 1"):
+            CircuitBreaker(failure_threshold=-1)
+
+    def test_disabled_feature_flag_returns_function_undecorated(self, monkeypatch):
+        """Test a disabled decorator adds no wrapper at all."""
+        from ai_companion.settings import settings
+
+        monkeypatch.setattr(settings, "FEATURE_CIRCUIT_BREAKER_ENABLED", False)
+
+        def plain_call():
+            return "ok"
+
+        assert circuit_breaker(failure_threshold=2)(plain_call) is plain_call
+
+
+class TestNullCircuitBreaker:
+    """Test the pass-through breaker used when circuit breaking is disabled."""
+
+    def test_failures_never_open_circuit(self):
+        """Test failures propagate without state tracking."""
+        breaker = NullCircuitBreaker(name="NullBreaker")
+
+        def failing_call():
+            raise Exception("Service unavailable")
+
+        for _ in range(10):
+            with pytest.raises(Exception, match="Service unavailable"):
+                breaker.call(failing_call)
+
+        assert breaker.state == "CLOSED"
+
+    @pytest.mark.asyncio
+    async def test_async_passthrough(self):
+        """Test async calls are awaited directly."""
+        breaker = NullCircuitBreaker(name="AsyncNullBreaker")
+
+        async def successful_call(value):
+            return value
+
+        assert await breaker.call_async(successful_call, "ok") == "ok"
+
+
+class TestGlobalCircuitBreakers:
+    """Test the lazily created per-service circuit breakers."""
+
+    def test_import_does_not_create_breakers(self):
+        """Test importing the module allocates no breakers and does not load settings."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys\n"
+            "import ai_companion.core.resilience as r\n"
+            "assert r._groq_circuit_breaker is None\n"
+            "assert r._elevenlabs_circuit_breaker is None\n"
+            "assert r._qdrant_circuit_breaker is None\n"
+            "assert 'ai_companion.settings' not in sys.modules\n"
+        )
+        src = Path(__file__).parent.parent / "src"
+        result = subprocess.run(
+            [sys.executable, "-c", code], env={"PYTHONPATH": str(src)}, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_accessors_return_singletons(self):
+        """Test each accessor creates its breaker once and reuses it."""
+        from ai_companion.core.resilience import (
+            get_elevenlabs_circuit_breaker,
+            get_groq_circuit_breaker,
+            get_qdrant_circuit_breaker,
+        )
+
+        for accessor in (get_groq_circuit_breaker, get_elevenlabs_circuit_breaker, get_qdrant_circuit_breaker):
+            assert accessor() is accessor()
+
+    def test_disabled_feature_flag_returns_null_breaker(self, monkeypatch):
+        """Test FEATURE_CIRCUIT_BREAKER_ENABLED=false yields pass-through breakers."""
+        import ai_companion.core.resilience as resilience
+        from ai_companion.settings import settings
+
+        monkeypatch.setattr(settings, "FEATURE_CIRCUIT_BREAKER_ENABLED", False)
+        monkeypatch.setattr(resilience, "_groq_circuit_breaker", None)
+
+        assert isinstance(resilience.get_groq_circuit_breaker(), NullCircuitBreaker)
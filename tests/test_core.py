@@ -1,10 +1,14 @@
 import unittest
+from datetime import datetime
+from unittest.mock import patch
 
 from ai_companion.core.exceptions import (
     SpeechToTextError,
     TextToSpeechError,
 )
-from ai_companion.core.retry import retry_with_exponential_backoff
+from ai_companion.core.retry import _backoff_schedule, retry_with_exponential_backoff
+from ai_companion.core.schedules import MONDAY_SCHEDULE, NO_SLOT, SLOT_BY_MINUTE, TUESDAY_SCHEDULE
+from ai_companion.modules.schedules.context_generation import ScheduleContextGenerator
 
 
 class TestRetryUtilities(unittest.TestCase):
@@ -44,6 +48,54 @@ class TestRetryUtilities(unittest.TestCase):
             always_fail()
         self.assertEqual(calls["n"], 3)
 
+    def test_retry_accepts_single_exception_type(self):
+        calls = {"n": 0}
+
+        @retry_with_exponential_backoff(
+            max_retries=3, initial_backoff=0.0, max_backoff=0.0, exceptions=ConnectionError, skip_exceptions=[]
+        )
+        def flaky():
+            calls["n"] += 1
+            if calls["n"] < 2:
+                raise ConnectionError("reset")
+            return "ok"
+
+        self.assertEqual(flaky(), "ok")
+        self.assertEqual(calls["n"], 2)
+
+    def test_single_attempt_logs_failure(self):
+        calls = {"n": 0}
+
+        @retry_with_exponential_backoff(max_retries=1, initial_backoff=0.0, max_backoff=0.0)
+        def fail_once():
+            calls["n"] += 1
+            raise ConnectionError("down")
+
+        with self.assertLogs("ai_companion.core.retry", level="WARNING") as logs:
+            with self.assertRaises(ConnectionError):
+                fail_once()
+        self.assertEqual(calls["n"], 1)
+        self.assertIn("fail_once failed after 1 attempts: down", logs.output[-1])
+
+    def test_backoff_schedule_doubles_and_caps(self):
+        self.assertEqual(_backoff_schedule(5, 1.0, 5.0), (1.0, 2.0, 4.0, 5.0))
+        self.assertEqual(_backoff_schedule(1, 1.0, 5.0), ())
+
+    def test_retry_waits_are_jittered_within_schedule(self):
+        @retry_with_exponential_backoff(max_retries=4, initial_backoff=1.0, max_backoff=3.0)
+        def always_fail():
+            raise RuntimeError("still failing")
+
+        with patch("ai_companion.core.retry.time.sleep") as sleep:
+            with self.assertRaises(RuntimeError):
+                always_fail()
+
+        waits = [c.args[0] for c in sleep.call_args_list]
+        self.assertEqual(len(waits), 3)
+        for wait, cap in zip(waits, (1.0, 2.0, 3.0)):
+            self.assertGreaterEqual(wait, 0.0)
+            self.assertLessEqual(wait, cap)
+
 
 class TestCustomExceptions(unittest.TestCase):
     def test_exceptions_are_subclasses(self):
@@ -55,5 +107,34 @@ class TestCustomExceptions(unittest.TestCase):
         self.assertEqual(str(e), "failure")
 
 
+class TestScheduleContext(unittest.TestCase):
+    def setUp(self):
+        ScheduleContextGenerator._activity_cache = None
+
+    def _activity_at(self, moment):
+        return ScheduleContextGenerator._activity_at(moment)
+
+    def test_activity_for_daytime_slots(self):
+        # 2024-01-01 is a Monday
+        self.assertEqual(self._activity_at(datetime(2024, 1, 1, 6, 30)), MONDAY_SCHEDULE["06:00-07:00"])
+        self.assertEqual(self._activity_at(datetime(2024, 1, 1, 8, 30)), MONDAY_SCHEDULE["08:30-10:00"])
+        self.assertEqual(self._activity_at(datetime(2024, 1, 2, 22, 59)), TUESDAY_SCHEDULE["22:00-23:00"])
+
+    def test_activity_for_overnight_slot(self):
+        self.assertEqual(self._activity_at(datetime(2024, 1, 1, 23, 30)), MONDAY_SCHEDULE["23:00-06:00"])
+        self.assertEqual(self._activity_at(datetime(2024, 1, 1, 3, 0)), MONDAY_SCHEDULE["23:00-06:00"])
+
+    def test_every_minute_has_a_slot(self):
+        self.assertEqual(len(SLOT_BY_MINUTE), 24 * 60)
+        self.assertNotIn(NO_SLOT, SLOT_BY_MINUTE)
+
+    def test_activity_is_cached_within_the_minute(self):
+        with patch("ai_companion.modules.schedules.context_generation.time.time", return_value=600.0):
+            with patch.object(ScheduleContextGenerator, "_activity_at", return_value="first") as lookup:
+                self.assertEqual(ScheduleContextGenerator.get_current_activity(), "first")
+                self.assertEqual(ScheduleContextGenerator.get_current_activity(), "first")
+        self.assertEqual(lookup.call_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -159,6 +159,17 @@ class TestProductionReadiness:
         logger = logging.getLogger("ai_companion")
         assert logger is not None
 
+    def test_json_log_serializer_handles_structlog_events(self):
+        """Test that the fast JSON serializer matches what JSONRenderer expects."""
+        import json
+
+        from ai_companion.core import logging_config
+
+        line = logging_config._orjson_dumps({"event": "e", "counts": {1: 2}, "obj": object()}, default=repr)
+
+        assert isinstance(line, str)
+        assert json.loads(line)["counts"] == {"1": 2}
+
     def test_error_handling(self):
         """Test that error handling is in place."""
         from fastapi.testclient import TestClient
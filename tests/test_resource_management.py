@@ -16,7 +16,8 @@ os.environ.setdefault("TOGETHER_API_KEY", "test_key")
 os.environ.setdefault("QDRANT_URL", "http://localhost:6333")
 os.environ.setdefault("QDRANT_API_KEY", "test_key")
 
-from ai_companion.core.session_cleanup import SessionCleanupManager
+from ai_companion.core.checkpointer import open_sqlite_checkpointer
+from ai_companion.core.session_cleanup import SessionCleanupManager, checkpoint_id_floor
 from ai_companion.modules.memory.long_term.vector_store import VectorStore, get_vector_store
 
 
@@ -98,23 +99,23 @@ class TestSessionCleanup:
         # Old session (should be deleted)
         cursor.execute(
             "INSERT INTO checkpoints (thread_id, checkpoint_id, metadata) VALUES (?, ?, ?)",
-            ("old_session_1", str(old_date.timestamp()), "{}"),
+            ("old_session_1", checkpoint_id_floor(old_date), "{}"),
         )
 
         # Recent session (should be kept)
         cursor.execute(
             "INSERT INTO checkpoints (thread_id, checkpoint_id, metadata) VALUES (?, ?, ?)",
-            ("recent_session_1", str(recent_date.timestamp()), "{}"),
+            ("recent_session_1", checkpoint_id_floor(recent_date), "{}"),
         )
 
         # Mixed session with both old and recent checkpoints (should be kept)
         cursor.execute(
             "INSERT INTO checkpoints (thread_id, checkpoint_id, metadata) VALUES (?, ?, ?)",
-            ("mixed_session_1", str(old_date.timestamp()), "{}"),
+            ("mixed_session_1", checkpoint_id_floor(old_date), "{}"),
         )
         cursor.execute(
             "INSERT INTO checkpoints (thread_id, checkpoint_id, metadata) VALUES (?, ?, ?)",
-            ("mixed_session_1", str(recent_date.timestamp()), "{}"),
+            ("mixed_session_1", checkpoint_id_floor(recent_date), "{}"),
         )
 
         conn.commit()
@@ -164,6 +165,53 @@ class TestSessionCleanup:
         assert "recent_session_1" in remaining_sessions
         assert "mixed_session_1" in remaining_sessions
 
+    def test_cleanup_deletes_in_batches(self, temp_db, monkeypatch):
+        """Test that cleanup deletes old sessions across several batches."""
+        monkeypatch.setattr("ai_companion.core.session_cleanup.DELETE_BATCH_SIZE", 2)
+
+        old_id = checkpoint_id_floor(datetime.now() - timedelta(days=10))
+        conn = sqlite3.connect(temp_db)
+        conn.executemany(
+            "INSERT INTO checkpoints (thread_id, checkpoint_id, metadata) VALUES (?, ?, ?)",
+            [(f"old_session_{i}", old_id, "{}") for i in range(2, 7)],
+        )
+        conn.commit()
+        conn.close()
+
+        manager = SessionCleanupManager(db_path=temp_db)
+        stats = manager.cleanup_old_sessions(retention_days=7)
+
+        assert stats["sessions_deleted"] == 6
+        assert stats["checkpoints_deleted"] == 6
+        assert stats["errors"] == []
+
+    def test_cleanup_vacuums_after_large_delete(self, temp_db, monkeypatch):
+        """Test that a large cleanup switches the database to incremental auto_vacuum."""
+        from ai_companion.settings import settings
+
+        monkeypatch.setattr(settings, "SESSION_CLEANUP_VACUUM_THRESHOLD", 1)
+        monkeypatch.setattr(settings, "SESSION_CLEANUP_FULL_VACUUM", True)
+
+        manager = SessionCleanupManager(db_path=temp_db)
+        stats = manager.cleanup_old_sessions(retention_days=7)
+
+        conn = sqlite3.connect(temp_db)
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        conn.close()
+
+        assert stats["errors"] == []
+        assert auto_vacuum == 2  # INCREMENTAL
+
+    def test_checkpoint_id_floor_orders_langgraph_ids(self):
+        """Test that the cutoff bound sorts around real LangGraph checkpoint IDs."""
+        from langgraph.checkpoint.base.id import uuid6
+
+        checkpoint_id = str(uuid6(clock_seq=-1))
+        now = datetime.now()
+
+        assert checkpoint_id_floor(now - timedelta(seconds=1)) < checkpoint_id
+        assert checkpoint_id < checkpoint_id_floor(now + timedelta(seconds=1))
+
     def test_cleanup_nonexistent_database(self):
         """Test cleanup handles nonexistent database gracefully."""
         manager = SessionCleanupManager(db_path="/nonexistent/path/db.db")
@@ -191,6 +239,21 @@ class TestSessionCleanup:
         Path(db_path).unlink(missing_ok=True)
 
 
+class TestCheckpointerConnection:
+    """Test suite for the shared SQLite checkpointer connection."""
+
+    async def test_checkpointer_skips_fsync_per_commit(self, tmp_path):
+        """Test that the checkpointer connection uses WAL with synchronous=NORMAL."""
+        async with open_sqlite_checkpointer(tmp_path / "checkpoints.db") as checkpointer:
+            async with checkpointer.conn.execute("PRAGMA journal_mode") as cursor:
+                journal_mode = (await cursor.fetchone())[0]
+            async with checkpointer.conn.execute("PRAGMA synchronous") as cursor:
+                synchronous = (await cursor.fetchone())[0]
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+
 class TestRequestSizeLimits:
     """Test suite for FastAPI request size limits."""
 
@@ -279,3 +279,116 @@ class TestAudioServing:
             assert "expired" in detail or "doesn't exist" in detail
         finally:
             app.dependency_overrides.clear()
+
+
+class TestWebSocketPartialStream:
+    """Test the WebSocket reply when sentence audio was only partly streamed."""
+
+    @staticmethod
+    def _session(received):
+        """Build a WebSocket session that records what the client receives."""
+        from ai_companion.interfaces.web.routes.voice_websocket import VoiceWebSocketSession
+
+        websocket = MagicMock()
+        websocket.send_json = AsyncMock(side_effect=lambda message: received.append(message["type"]))
+        websocket.send_bytes = AsyncMock(side_effect=received.append)
+        return VoiceWebSocketSession(websocket, "test-session")
+
+    @staticmethod
+    def _graph(stream):
+        """Build a graph whose astream yields the given events; an int event sleeps that many ms."""
+        import asyncio
+
+        async def astream(*args, **kwargs):
+            for event in stream:
+                if isinstance(event, int):
+                    await asyncio.sleep(event / 1000)
+                else:
+                    yield event
+
+        graph = MagicMock()
+        graph.astream = astream
+        return graph
+
+    def _run(self, stream):
+        """Run _run_workflow over the given stream events and return what the client received."""
+        import asyncio
+
+        from ai_companion.interfaces.web.routes.voice_websocket import _run_workflow
+
+        received = []
+        asyncio.run(_run_workflow(self._session(received), self._graph(stream), {}, {}))
+        return received
+
+    def _respond(self, stream, monkeypatch):
+        """Run a whole voice turn with a 50 ms workflow timeout and return what the client received."""
+        import asyncio
+
+        from ai_companion.interfaces.web.routes import voice_websocket
+        from ai_companion.settings import settings
+
+        monkeypatch.setattr(settings, "WORKFLOW_TIMEOUT_SECONDS", 0.05)
+        stt = MagicMock()
+        stt.transcribe = AsyncMock(return_value="hello")
+        monkeypatch.setattr(voice_websocket, "get_stt", lambda: stt)
+
+        received = []
+        session = self._session(received)
+        session._graph = self._graph(stream)
+        session.audio_buffer.extend(b"\x00" * 2000)
+        asyncio.run(voice_websocket._process_audio_and_respond(session))
+        return received
+
+    def test_voice_failing_after_first_sentence_does_not_repeat_audio(self):
+        """Test that audio already streamed is not resent when the rest of the reply could not be voiced."""
+        received = self._run(
+            [
+                ("custom", {"audio_chunk": b"One."}),
+                (
+                    "updates",
+                    {"audio_node": {"messages": AIMessage(content="One. voice down: Two."), "audio_buffer": b"One."}},
+                ),
+            ]
+        )
+
+        assert received == ["audio_start", b"One.", "response", "audio_end"]
+
+    def test_unsent_tail_of_reply_audio_is_sent(self):
+        """Test that the part of audio_buffer beyond the streamed chunks reaches the client before audio_end."""
+        received = self._run(
+            [
+                ("custom", {"audio_chunk": b"One."}),
+                ("updates", {"audio_node": {"messages": AIMessage(content="One. Two."), "audio_buffer": b"One.Two."}}),
+            ]
+        )
+
+        assert received == ["audio_start", b"One.", "response", b"Two.", "audio_end"]
+
+    def test_step_after_reply_gets_its_own_budget(self, monkeypatch):
+        """Test that the reply's time does not count against the summary that runs after it."""
+        reply = {"messages": AIMessage(content="Hi."), "audio_buffer": b"hi"}
+        stream = iter([30, ("updates", {"audio_node": reply}), 30, ("updates", {"summarize_conversation_node": {}})])
+        received = self._respond(stream, monkeypatch)
+
+        assert next(stream, None) is None  # the summary update was reached
+        assert received == ["transcription", "response", "audio_start", b"hi", "audio_end"]
+
+    def test_hung_step_after_reply_is_cut_off_without_an_error(self, monkeypatch):
+        """Test that a summary hanging after the reply is sent ends within the budget and the client sees no error."""
+        import time
+
+        reply = {"messages": AIMessage(content="Hi."), "audio_buffer": b"hi"}
+        started = time.monotonic()
+        received = self._respond(
+            [("updates", {"audio_node": reply}), 5000, ("updates", {"summarize_conversation_node": {}})],
+            monkeypatch,
+        )
+
+        assert time.monotonic() - started < 1
+        assert received == ["transcription", "response", "audio_start", b"hi", "audio_end"]
+
+    def test_slow_step_before_reply_still_times_out(self, monkeypatch):
+        """Test that the client gets a timeout error when the reply itself is late."""
+        received = self._respond([100, ("updates", {"audio_node": {}})], monkeypatch)
+
+        assert received == ["transcription", "error"]
@@ -0,0 +1,484 @@
+"""Unit tests for LangGraph workflow node helpers.
+
+Tests the pure helpers used by the nodes, without running the graph.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage
+
+from ai_companion.graph import nodes
+
+
+@pytest.mark.unit
+class TestRecentContext:
+    """Test the memory query built from recent messages."""
+
+    def test_joins_last_messages(self):
+        """Test that only the most recent messages are joined in order."""
+        messages = [HumanMessage(content=f"message {i}") for i in range(5)]
+
+        assert nodes._recent_context(messages) == "message 2 message 3 message 4"
+
+    def test_handles_multimodal_content(self):
+        """Test that list-of-parts content contributes its text parts."""
+        messages = [
+            HumanMessage(content=[{"type": "text", "text": "look at this"}, {"type": "image_url", "image_url": "x"}]),
+            AIMessage(content="I see it"),
+        ]
+
+        assert nodes._recent_context(messages) == "look at this I see it"
+
+    def test_skips_blank_and_repeated_messages(self):
+        """Test that empty turns and exact repeats do not pad the memory query."""
+        messages = [HumanMessage(content="I feel sad"), AIMessage(content="  "), HumanMessage(content="I feel sad")]
+
+        assert nodes._recent_context(messages) == "I feel sad"
+
+    def test_caps_length_keeping_newest_text(self):
+        """Test that long histories are trimmed to the newest characters."""
+        messages = [HumanMessage(content="a" * 3000), HumanMessage(content="newest")]
+
+        context = nodes._recent_context(messages)
+
+        assert len(context) == nodes.MEMORY_CONTEXT_MAX_CHARS
+        assert context.endswith(" newest")
+
+
+@pytest.mark.unit
+class TestNodeFactories:
+    """Test that node dependencies are shared across turns."""
+
+    def test_text_to_speech_module_is_shared(self):
+        """Test that the TTS module (and so its audio cache) is reused."""
+        from ai_companion.graph.utils.helpers import get_text_to_speech_module
+
+        assert get_text_to_speech_module() is get_text_to_speech_module()
+
+    def test_character_chain_is_shared_and_takes_summary_as_input(self):
+        """Test that one chain serves every summary, including ones containing braces."""
+        from ai_companion.graph.utils.chains import format_summary_context, get_character_response_chain
+
+        chain = get_character_response_chain()
+        prompt = chain.first.invoke(
+            {
+                "messages": [HumanMessage(content="hi")],
+                "current_activity": "resting",
+                "memory_context": "",
+                "summary_context": format_summary_context("user said {not a variable}"),
+            }
+        )
+
+        assert chain is get_character_response_chain()
+        assert "user said {not a variable}" in prompt.messages[1].content
+        assert format_summary_context("") == ""
+
+    def test_character_card_is_a_fixed_prompt_prefix(self):
+        """Test that per-turn context goes after the character card, leaving the card unchanged."""
+        from ai_companion.core.prompts import CHARACTER_CARD_PROMPT
+        from ai_companion.graph.utils.chains import format_summary_context, get_character_response_chain
+
+        prompt = get_character_response_chain().first.invoke(
+            {
+                "messages": [HumanMessage(content="hi")],
+                "current_activity": "Tending the garden",
+                "memory_context": "- Name is Sam",
+                "summary_context": format_summary_context("Sam talked about work"),
+            }
+        )
+
+        assert prompt.messages[0].content == CHARACTER_CARD_PROMPT
+        assert "- Name is Sam" in prompt.messages[1].content
+        assert "Tending the garden" in prompt.messages[1].content
+        assert "Sam talked about work" in prompt.messages[1].content
+
+    def test_chat_model_is_cached_per_temperature(self):
+        """Test that chat models are reused for the same temperature only."""
+        from ai_companion.graph.utils.helpers import get_chat_model
+
+        assert get_chat_model() is get_chat_model()
+        assert get_chat_model(0.1) is not get_chat_model(0.9)
+
+
+@pytest.mark.unit
+class TestSummarySettings:
+    """Test that the summary thresholds follow settings changed at runtime."""
+
+    def test_edge_reads_the_current_trigger(self, monkeypatch):
+        """Test that lowering the trigger after import takes effect on the next turn."""
+        from ai_companion.graph import edges
+        from ai_companion.settings import settings
+
+        monkeypatch.setattr(settings, "TOTAL_MESSAGES_SUMMARY_TRIGGER", 4)
+
+        messages = [HumanMessage(content="hi")] * 5
+        assert edges.should_summarize_conversation({"messages": messages}) == "summarize_conversation_node"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSummarizeConversationNode:
+    """Test summary generation and history trimming."""
+
+    async def test_removes_all_but_the_most_recent_messages(self):
+        """Test that older messages are removed and the configured tail is kept."""
+        from ai_companion.settings import settings
+
+        messages = [HumanMessage(content=f"message {i}", id=f"id-{i}") for i in range(25)]
+        model = MagicMock()
+        model.ainvoke = AsyncMock(return_value=AIMessage(content="new summary"))
+
+        with patch("ai_companion.graph.nodes.get_chat_model", return_value=model):
+            result = await nodes.summarize_conversation_node({"messages": messages, "summary": ""})
+
+        removed = result["messages"]
+        assert result["summary"] == "new summary"
+        assert all(isinstance(m, RemoveMessage) for m in removed)
+        assert [m.id for m in removed] == [f"id-{i}" for i in range(25 - settings.TOTAL_MESSAGES_AFTER_SUMMARY)]
+
+    async def test_zero_keep_count_removes_nothing(self, monkeypatch):
+        """Test that TOTAL_MESSAGES_AFTER_SUMMARY=0 keeps the history, like the old messages[:-0] slice."""
+        from ai_companion.settings import settings
+
+        monkeypatch.setattr(settings, "TOTAL_MESSAGES_AFTER_SUMMARY", 0)
+        messages = [HumanMessage(content=f"message {i}", id=f"id-{i}") for i in range(5)]
+        model = MagicMock()
+        model.ainvoke = AsyncMock(return_value=AIMessage(content="new summary"))
+
+        with patch("ai_companion.graph.nodes.get_chat_model", return_value=model):
+            result = await nodes.summarize_conversation_node({"messages": messages, "summary": ""})
+
+        assert result["summary"] == "new summary"
+        assert result["messages"] == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMemoryExtractionNode:
+    """Test that memory extraction runs off the critical path."""
+
+    async def test_extraction_is_queued_for_a_worker(self):
+        """Test that the node returns at once and a worker runs the extraction, then exits."""
+        import asyncio
+
+        manager = MagicMock()
+        manager.extract_and_store_memories = AsyncMock()
+        state = {"messages": [HumanMessage(content="My sister's name is Ana")]}
+
+        with patch("ai_companion.graph.nodes.get_memory_manager", return_value=manager):
+            result = await nodes.memory_extraction_node(state, {"configurable": {"thread_id": "s1"}})
+            assert result == {}
+            assert len(nodes._background_tasks) == 1
+
+            await asyncio.gather(*nodes._background_tasks)
+
+        manager.extract_and_store_memories.assert_awaited_once_with(state["messages"][0], session_id="s1")
+        assert not nodes._background_tasks
+
+    async def test_extraction_is_dropped_when_backlog_is_full(self, monkeypatch):
+        """Test that a full backlog drops the new extraction instead of blocking the turn."""
+        import asyncio
+
+        monkeypatch.setattr(nodes, "MEMORY_EXTRACTION_WORKERS", 1)
+        monkeypatch.setattr(nodes, "MEMORY_EXTRACTION_QUEUE_SIZE", 2)
+        release = asyncio.Event()
+
+        async def _block(*args, **kwargs):
+            await release.wait()
+
+        manager = MagicMock()
+        manager.extract_and_store_memories = AsyncMock(side_effect=_block)
+        state = {"messages": [HumanMessage(content="hello")]}
+
+        with patch("ai_companion.graph.nodes.get_memory_manager", return_value=manager):
+            await nodes.memory_extraction_node(state, {})
+            await asyncio.sleep(0)  # the worker takes the first item and blocks on it
+            assert manager.extract_and_store_memories.await_count == 1
+            assert not nodes._pending_extractions
+
+            for _ in range(nodes.MEMORY_EXTRACTION_QUEUE_SIZE):
+                await nodes.memory_extraction_node(state, {})  # fills the backlog
+            assert len(nodes._pending_extractions) == nodes.MEMORY_EXTRACTION_QUEUE_SIZE
+
+            assert nodes._queue_memory_extraction(state["messages"][0], None) is False  # dropped
+            assert len(nodes._pending_extractions) == nodes.MEMORY_EXTRACTION_QUEUE_SIZE
+            assert len(nodes._background_tasks) == 1
+
+            release.set()
+            await asyncio.gather(*nodes._background_tasks)
+
+        assert manager.extract_and_store_memories.await_count == 1 + nodes.MEMORY_EXTRACTION_QUEUE_SIZE
+        assert not nodes._pending_extractions
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMemoryInjectionNode:
+    """Test that memory retrieval is skipped when there is nothing to look up."""
+
+    async def test_blank_history_skips_memory_manager(self):
+        """Test that a history with no text never reaches the memory manager."""
+        with patch("ai_companion.graph.nodes.get_memory_manager") as get_manager:
+            result = await nodes.memory_injection_node({"messages": [HumanMessage(content=" ")]}, {})
+
+        assert result == {"memory_context": ""}
+        get_manager.assert_not_called()
+
+    async def test_disabled_long_term_memory_skips_memory_manager(self, monkeypatch):
+        """Test that the feature flag turns off retrieval entirely."""
+        from ai_companion.settings import settings
+
+        monkeypatch.setattr(settings, "FEATURE_LONG_TERM_MEMORY_ENABLED", False)
+
+        with patch("ai_companion.graph.nodes.get_memory_manager") as get_manager:
+            result = await nodes.memory_injection_node({"messages": [HumanMessage(content="hi")]}, {})
+
+        assert result == {"memory_context": ""}
+        get_manager.assert_not_called()
+
+    async def test_slow_memory_lookup_is_skipped_after_budget(self, monkeypatch):
+        """Test that a hung lookup yields empty context once the retrieval budget runs out."""
+        import threading
+
+        from ai_companion.settings import settings
+
+        monkeypatch.setattr(settings, "MEMORY_RETRIEVAL_TIMEOUT_SECONDS", 0.05)
+        release = threading.Event()
+        manager = MagicMock()
+        manager.get_relevant_memories.side_effect = lambda *args, **kwargs: release.wait(5) and []
+
+        try:
+            with patch("ai_companion.graph.nodes.get_memory_manager", return_value=manager):
+                result = await nodes.memory_injection_node({"messages": [HumanMessage(content="hi")]}, {})
+        finally:
+            release.set()
+
+        assert result == {"memory_context": ""}
+
+    async def test_abandoned_lookups_are_capped(self, monkeypatch):
+        """Test that timed-out lookups still hold their slot, so a saturated pool skips new ones."""
+        import threading
+
+        from ai_companion.settings import settings
+
+        monkeypatch.setattr(settings, "MEMORY_RETRIEVAL_TIMEOUT_SECONDS", 0.05)
+        monkeypatch.setattr(nodes, "_memory_retrieval_slots", threading.BoundedSemaphore(1))
+        release = threading.Event()
+        manager = MagicMock()
+        manager.get_relevant_memories.side_effect = lambda *args, **kwargs: release.wait(5) and []
+        state = {"messages": [HumanMessage(content="hi")]}
+
+        try:
+            with patch("ai_companion.graph.nodes.get_memory_manager", return_value=manager):
+                await nodes.memory_injection_node(state, {})  # times out, thread keeps running
+                result = await nodes.memory_injection_node(state, {})  # no free slot
+        finally:
+            release.set()
+
+        assert result == {"memory_context": ""}
+        assert manager.get_relevant_memories.call_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConversationNodeFallback:
+    """Test the reply used when the conversation chain fails."""
+
+    async def test_each_failure_gets_its_own_fallback_message(self):
+        """Test that fallbacks are separate messages so history appends rather than replaces."""
+        chain = MagicMock()
+        chain.ainvoke = AsyncMock(side_effect=RuntimeError("groq down"))
+        state = {"messages": [HumanMessage(content="hello")], "summary": ""}
+
+        with patch("ai_companion.graph.nodes.get_character_response_chain", return_value=chain):
+            first = await nodes.conversation_node(state, {})
+            second = await nodes.conversation_node(state, {})
+
+        assert first["messages"].content == nodes.CONVERSATION_FALLBACK_TEXT
+        assert first["messages"] is not second["messages"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAudioNodeStreaming:
+    """Test that the reply is synthesized sentence by sentence while it streams."""
+
+    @staticmethod
+    def _streaming_chain(chunks):
+        """Build a Runnable chain that streams the given text chunks."""
+        from langchain_core.runnables import RunnableGenerator
+
+        async def generate(_):
+            for chunk in chunks:
+                yield chunk
+
+        return RunnableGenerator(generate)
+
+    async def test_sentences_are_synthesized_and_joined(self):
+        """Test that each complete sentence gets its own TTS call and the audio is concatenated."""
+        chain = self._streaming_chain(["Hi there. *smi", "les* How are", " you? Good"])
+        tts = MagicMock()
+        tts.synthesize_with_fallback = AsyncMock(side_effect=lambda text: (text.encode(), text))
+        state = {"messages": [HumanMessage(content="hello")], "summary": ""}
+
+        with (
+            patch("ai_companion.graph.nodes.get_character_response_chain", return_value=chain),
+            patch("ai_companion.graph.nodes.get_text_to_speech_module", return_value=tts),
+        ):
+            result = await nodes.audio_node(state, {})
+
+        sentences = [call.args[0] for call in tts.synthesize_with_fallback.await_args_list]
+        assert sentences == ["Hi there.", "How are you?", "Good"]
+        assert result["audio_buffer"] == b"Hi there.How are you?Good"
+        assert result["messages"].content == "Hi there.  How are you? Good"
+
+    async def test_audio_keeps_sentence_order_when_synthesis_overlaps(self):
+        """Test that a slow first sentence does not block later ones or reorder the audio."""
+        import asyncio
+
+        chain = self._streaming_chain(["Slow one. ", "Fast two."])
+        finished = []
+
+        async def synthesize(text):
+            await asyncio.sleep(0.05 if text.startswith("Slow") else 0)
+            finished.append(text)
+            return text.encode(), text
+
+        tts = MagicMock()
+        tts.synthesize_with_fallback = AsyncMock(side_effect=synthesize)
+        state = {"messages": [HumanMessage(content="hello")], "summary": ""}
+
+        with (
+            patch("ai_companion.graph.nodes.get_character_response_chain", return_value=chain),
+            patch("ai_companion.graph.nodes.get_text_to_speech_module", return_value=tts),
+        ):
+            result = await nodes.audio_node(state, {})
+
+        assert finished == ["Fast two.", "Slow one."]
+        assert result["audio_buffer"] == b"Slow one.Fast two."
+
+    async def test_sentence_audio_is_written_to_the_stream_in_order(self):
+        """Test that each sentence's audio is emitted as a custom stream event as soon as it is ready."""
+        chain = self._streaming_chain(["One. Two", ". Three"])
+        tts = MagicMock()
+        tts.synthesize_with_fallback = AsyncMock(side_effect=lambda text: (text.encode(), text))
+        state = {"messages": [HumanMessage(content="hello")], "summary": ""}
+        events = []
+
+        with (
+            patch("ai_companion.graph.nodes.get_character_response_chain", return_value=chain),
+            patch("ai_companion.graph.nodes.get_text_to_speech_module", return_value=tts),
+        ):
+            result = await nodes.audio_node(state, {}, writer=events.append)
+
+        assert events == [{"audio_chunk": b"One."}, {"audio_chunk": b"Two."}, {"audio_chunk": b"Three"}]
+        assert result["audio_buffer"] == b"One.Two.Three"
+
+    async def test_uses_activity_from_state(self):
+        """Test that the activity injected earlier in the turn is reused, not looked up again."""
+        seen = {}
+
+        async def respond(inputs):
+            seen.update(inputs)
+            return "Hi."
+
+        from langchain_core.runnables import RunnableLambda
+
+        tts = MagicMock()
+        tts.synthesize_with_fallback = AsyncMock(return_value=(b"hi", "Hi."))
+        state = {"messages": [HumanMessage(content="hello")], "summary": "", "current_activity": "Gardening"}
+
+        with (
+            patch("ai_companion.graph.nodes.get_character_response_chain", return_value=RunnableLambda(respond)),
+            patch("ai_companion.graph.nodes.get_text_to_speech_module", return_value=tts),
+            patch("ai_companion.graph.nodes.ScheduleContextGenerator.get_current_activity") as lookup,
+        ):
+            await nodes.audio_node(state, {})
+
+        lookup.assert_not_called()
+        assert seen["current_activity"] == "Gardening"
+
+    async def test_failed_first_sentence_falls_back_for_whole_reply(self):
+        """Test that when the first segment fails, one fallback call covers the full reply."""
+        chain = self._streaming_chain(["One. ", "Two."])
+        tts = MagicMock()
+        tts.synthesize_with_fallback = AsyncMock(
+            side_effect=[(None, "One."), (b"two", "Two."), (None, "voice down: One. Two.")]
+        )
+        state = {"messages": [HumanMessage(content="hello")], "summary": ""}
+        events = []
+
+        with (
+            patch("ai_companion.graph.nodes.get_character_response_chain", return_value=chain),
+            patch("ai_companion.graph.nodes.get_text_to_speech_module", return_value=tts),
+        ):
+            result = await nodes.audio_node(state, {}, writer=events.append)
+
+        assert tts.synthesize_with_fallback.await_args_list[-1].args == ("One. Two.",)
+        assert events == []
+        assert result["audio_buffer"] is None
+        assert result["messages"].content == "voice down: One. Two."
+
+    async def test_failed_middle_sentence_resynthesizes_only_the_rest(self):
+        """Test that audio already streamed is kept and only the reply from the failed sentence on is redone."""
+        chain = self._streaming_chain(["One. ", "Two. ", "Three. ", "Four."])
+        failed = set()
+
+        async def synthesize(text):
+            if text == "Three." and text not in failed:
+                failed.add(text)
+                return None, "voice down: Three."
+            return text.encode(), text
+
+        tts = MagicMock()
+        tts.synthesize_with_fallback = AsyncMock(side_effect=synthesize)
+        state = {"messages": [HumanMessage(content="hello")], "summary": ""}
+        events = []
+
+        with (
+            patch("ai_companion.graph.nodes.get_character_response_chain", return_value=chain),
+            patch("ai_companion.graph.nodes.get_text_to_speech_module", return_value=tts),
+        ):
+            result = await nodes.audio_node(state, {}, writer=events.append)
+
+        calls = [call.args[0] for call in tts.synthesize_with_fallback.await_args_list]
+        assert calls == ["One.", "Two.", "Three.", "Four.", "Three. Four."]
+        assert events == [{"audio_chunk": b"One."}, {"audio_chunk": b"Two."}, {"audio_chunk": b"Three. Four."}]
+        assert result["audio_buffer"] == b"".join(event["audio_chunk"] for event in events)
+        assert result["messages"].content == "One. Two. Three. Four."
+
+    async def test_voice_failing_mid_reply_keeps_spoken_audio(self):
+        """Test that if the rest of the reply cannot be voiced, the audio is what was streamed and the text is complete."""
+        chain = self._streaming_chain(["One. ", "Two."])
+        tts = MagicMock()
+        tts.synthesize_with_fallback = AsyncMock(
+            side_effect=[(b"one", "One."), (None, "Two."), (None, "voice down: Two.")]
+        )
+        state = {"messages": [HumanMessage(content="hello")], "summary": ""}
+        events = []
+
+        with (
+            patch("ai_companion.graph.nodes.get_character_response_chain", return_value=chain),
+            patch("ai_companion.graph.nodes.get_text_to_speech_module", return_value=tts),
+        ):
+            result = await nodes.audio_node(state, {}, writer=events.append)
+
+        assert tts.synthesize_with_fallback.await_count == 3
+        assert events == [{"audio_chunk": b"one"}]
+        assert result["audio_buffer"] == b"one"
+        assert result["messages"].content == "One. voice down: Two."
+
+
+@pytest.mark.unit
+class TestWorkflowGraph:
+    """Test the shape of the compiled workflow."""
+
+    def test_context_and_memory_nodes_run_in_parallel(self):
+        """Test that the preparation nodes all start from START and join at audio_node."""
+        from ai_companion.graph.graph import create_workflow_graph
+
+        edges = {(e.source, e.target) for e in create_workflow_graph().compile().get_graph().edges}
+        for node in ("memory_extraction_node", "context_injection_node", "memory_injection_node"):
+            assert ("__start__", node) in edges
+            assert (node, "audio_node") in edges
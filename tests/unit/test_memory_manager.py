@@ -278,6 +278,62 @@ class TestMemoryRetrieval:
             assert len(memories) == 2
             assert "guilt" in memories[1].lower()
 
+    def test_similar_context_reuses_cached_search(self, mock_qdrant_client):
+        """Test that a near-identical context is served from the semantic cache."""
+        import numpy as np
+
+        from ai_companion.modules.memory.long_term.vector_store import Memory
+
+        embeddings = {
+            "I miss my mother": np.array([1.0, 0.0, 0.0]),
+            "I really miss my mother": np.array([0.99, 0.1, 0.0]),
+            "Work has been stressful": np.array([0.0, 0.0, 1.0]),
+        }
+
+        with patch("ai_companion.modules.memory.long_term.memory_manager.get_vector_store") as mock_vs:
+            mock_vs.return_value.model.encode.side_effect = embeddings.__getitem__
+            mock_vs.return_value.search_memories.return_value = [
+                Memory(text="Grieving mother's death", metadata={"id": "mem1"}, score=0.9)
+            ]
+
+            manager = MemoryManager()
+            first = manager.get_relevant_memories("I miss my mother", session_id="s1")
+            second = manager.get_relevant_memories("I really miss my mother", session_id="s1")
+            assert second == first
+            assert mock_vs.return_value.search_memories.call_count == 1
+
+            # Dissimilar context or another session goes to the vector store
+            manager.get_relevant_memories("Work has been stressful", session_id="s1")
+            manager.get_relevant_memories("I really miss my mother", session_id="s2")
+            assert mock_vs.return_value.search_memories.call_count == 3
+
+    def test_invalidating_a_session_keeps_other_sessions_semantic_entries(self, mock_qdrant_client):
+        """Test that invalidate_cache(session_id) drops only that session's semantic cache entries."""
+        import numpy as np
+
+        from ai_companion.modules.memory.long_term.vector_store import Memory
+
+        embeddings = {
+            "I miss my mother": np.array([1.0, 0.0, 0.0]),
+            "I really miss my mother": np.array([0.99, 0.1, 0.0]),
+        }
+
+        with patch("ai_companion.modules.memory.long_term.memory_manager.get_vector_store") as mock_vs:
+            mock_vs.return_value.model.encode.side_effect = embeddings.__getitem__
+            mock_vs.return_value.search_memories.return_value = [
+                Memory(text="Grieving mother's death", metadata={"id": "mem1"}, score=0.9)
+            ]
+
+            manager = MemoryManager()
+            manager.get_relevant_memories("I miss my mother", session_id="s1")
+            manager.get_relevant_memories("I miss my mother", session_id="s2")
+            manager.invalidate_cache(session_id="s1")
+
+            manager.get_relevant_memories("I really miss my mother", session_id="s2")
+            assert mock_vs.return_value.search_memories.call_count == 2
+            manager.get_relevant_memories("I really miss my mother", session_id="s1")
+            assert mock_vs.return_value.search_memories.call_count == 3
+
 
 @pytest.mark.unit
 class TestMemoryFormatting:
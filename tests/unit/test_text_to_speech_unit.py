@@ -222,6 +222,35 @@ class TestCachingBehavior:
             assert stats["ttl_hours"] == 24
             assert len(stats["entries"]) == 2
 
+    def test_cache_evicts_least_recently_used_when_full(self, mock_elevenlabs_client):
+        """Test that a full cache drops the entry used longest ago, not one just read."""
+        with (
+            patch("ai_companion.modules.speech.text_to_speech.ElevenLabs", return_value=mock_elevenlabs_client),
+            patch("ai_companion.modules.speech.text_to_speech.TTS_CACHE_MAX_ENTRIES", 2),
+        ):
+            tts = TextToSpeech(enable_cache=True)
+            tts._add_to_cache("key1", b"audio1")
+            tts._add_to_cache("key2", b"audio2")
+            assert tts._get_from_cache("key1") == b"audio1"
+
+            tts._add_to_cache("key3", b"audio3")
+
+            assert set(tts._cache) == {"key1", "key3"}
+
+    @pytest.mark.asyncio
+    async def test_fallback_synthesis_is_served_from_cache(self, mock_elevenlabs_client):
+        """Test that the graph's synthesis path reuses cached audio, e.g. phrases warmed at startup."""
+        mock_elevenlabs_client.generate.return_value = iter([b"generated_audio"])
+
+        with patch("ai_companion.modules.speech.text_to_speech.ElevenLabs", return_value=mock_elevenlabs_client):
+            tts = TextToSpeech(enable_cache=True)
+            await tts.synthesize_cached("I'm here with you.")
+            audio, text = await tts.synthesize_with_fallback("I'm here with you.")
+
+            assert audio == b"generated_audio"
+            assert text == "I'm here with you."
+            assert mock_elevenlabs_client.generate.call_count == 1
+
 
 @pytest.mark.unit
 class TestFallbackBehavior:
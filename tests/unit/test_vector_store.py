@@ -11,6 +11,7 @@ import numpy as np
 import pytest
 
 from ai_companion.modules.memory.long_term.vector_store import (
+    EmbeddingBatcher,
     Memory,
     VectorStore,
     get_vector_store,
@@ -385,6 +386,57 @@ class TestMemoryDataClass:
         assert memory.timestamp is None
 
 
+@pytest.mark.unit
+class TestEmbeddingBatcher:
+    """Test coalescing of concurrent embedding requests."""
+
+    def test_requests_waiting_on_the_model_are_encoded_together(self):
+        """Test that texts queued behind a busy model are embedded in one batch, each getting its own vector."""
+        import threading
+        import time
+
+        calls = []
+
+        def encode(texts):
+            calls.append(texts)
+            if isinstance(texts, str):
+                time.sleep(0.1)  # hold the model while the other requests queue up
+                return np.array([float(len(texts))])
+            return np.array([[float(len(text))] for text in texts])
+
+        model = MagicMock()
+        model.encode.side_effect = encode
+        batcher = EmbeddingBatcher(model)
+
+        results = {}
+
+        def embed(text):
+            results[text] = batcher.encode(text)
+
+        first = threading.Thread(target=embed, args=("a",))
+        first.start()
+        time.sleep(0.02)
+        others = [threading.Thread(target=embed, args=(text,)) for text in ("bb", "ccc", "dddd")]
+        for thread in others:
+            thread.start()
+        for thread in [first, *others]:
+            thread.join()
+
+        assert calls[0] == "a"
+        assert sorted(calls[1]) == ["bb", "ccc", "dddd"]
+        assert len(calls) == 2
+        assert {text: float(vector[0]) for text, vector in results.items()} == {"a": 1, "bb": 2, "ccc": 3, "dddd": 4}
+
+    def test_model_error_is_raised_to_the_caller(self):
+        """Test that a failed encode raises for the caller instead of returning an empty result."""
+        model = MagicMock()
+        model.encode.side_effect = RuntimeError("model unavailable")
+        batcher = EmbeddingBatcher(model)
+
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            batcher.encode("hello")
+
+
 @pytest.mark.unit
 class TestVectorStoreSingleton:
     """Test VectorStore singleton pattern."""